@@ -0,0 +1,83 @@
+"""
+Numeric kernels for RiskGuard batch validation
+
+The per-order limit screen is compiled with Numba when it is installed;
+otherwise an equivalent NumPy expression is used. Ratio limits are compared
+as integer basis points: order ratios are rounded up and tested with >=, so
+the screen never passes an order the float checks in risk_guard would fail
+(orders at the boundary are flagged and re-checked exactly).
+
+screen_orders returns a uint8 failure bitmap per order:
+    bit 0  order size over max_single_bp
+    bit 1  resulting position over max_position_bp (BUY only)
+    bit 2  cash reserve violated (BUY only)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+BP_SCALE = 10_000
+
+FAIL_ORDER_SIZE = 1
+FAIL_POSITION = 2
+FAIL_CASH_RESERVE = 4
+
+
+def to_bp(pct: float) -> int:
+    """Ratio limit in [0, 1] as integer basis points"""
+    return int(round(pct * BP_SCALE))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def screen_orders(
+        order_values,
+        current_values,
+        is_buy,
+        inv_portfolio,
+        available_cash,
+        cash_reserve,
+        max_single_bp,
+        max_position_bp,
+    ):
+        n = order_values.shape[0]
+        fail = np.empty(n, dtype=np.uint8)
+        bp_scale = inv_portfolio * BP_SCALE
+        for i in range(n):
+            order_value = order_values[i]
+            order_bp = np.int64(np.ceil(order_value * bp_scale))
+            new_bp = np.int64(np.ceil((current_values[i] + order_value) * bp_scale))
+            buy = np.uint8(is_buy[i])
+            fail[i] = (
+                np.uint8(order_bp >= max_single_bp)
+                | (np.uint8(new_bp >= max_position_bp) & buy) << 1
+                | (np.uint8(available_cash - order_value < cash_reserve) & buy) << 2
+            )
+        return fail
+
+else:
+    def screen_orders(
+        order_values,
+        current_values,
+        is_buy,
+        inv_portfolio,
+        available_cash,
+        cash_reserve,
+        max_single_bp,
+        max_position_bp,
+    ):
+        bp_scale = inv_portfolio * BP_SCALE
+        order_bp = np.ceil(order_values * bp_scale).astype(np.int64)
+        new_bp = np.ceil((current_values + order_values) * bp_scale).astype(np.int64)
+        buy = is_buy.astype(np.uint8)
+        return (
+            (order_bp >= max_single_bp).astype(np.uint8)
+            | ((new_bp >= max_position_bp).astype(np.uint8) & buy) << 1
+            | ((available_cash - order_values < cash_reserve).astype(np.uint8) & buy) << 2
+        )
@@ -119,6 +119,11 @@ class AnalystAgent:
             "financial_statement": [],
         }
         self._analysis_cache: dict[str, AnalysisReport] = {}
+        # Bumped on every cache write; get_report memoizes its last lookup
+        # against it so repeated polling of one symbol skips the dict probe
+        self._report_cache_version = 0
+        self._last_report_key: tuple[str, int] | None = None
+        self._last_report: AnalysisReport | None = None
         
         self._technical_analyzer = None
         self._fundamental_analyzer = None
@@ -177,6 +182,7 @@ class AnalystAgent:
         report.confidence = self._calculate_confidence(report)
         
         self._analysis_cache[symbol] = report
+        self._report_cache_version += 1
         
         await self._publish_report(report)
         
@@ -293,7 +299,13 @@ class AnalystAgent:
         ))
     
     def get_report(self, symbol: str) -> AnalysisReport | None:
-        return self._analysis_cache.get(symbol)
+        key = (symbol, self._report_cache_version)
+        if key == self._last_report_key:
+            return self._last_report
+        report = self._analysis_cache.get(symbol)
+        self._last_report_key = key
+        self._last_report = report
+        return report
     
     def get_status(self) -> dict[str, Any]:
         return {
@@ -17,7 +17,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import StrEnum
 from typing import Any, Callable
 
 from core.event_bus import Event, EventBus
@@ -27,7 +27,7 @@ from core.events import CollectorEventType
 logger = logging.getLogger(__name__)
 
 
-class CollectionFrequency(str, Enum):
+class CollectionFrequency(StrEnum):
     REALTIME = "realtime"
     MINUTE_1 = "1m"
     MINUTE_5 = "5m"
@@ -37,7 +37,7 @@ class CollectionFrequency(str, Enum):
     WEEKLY = "1w"
 
 
-class DataSource(str, Enum):
+class DataSource(StrEnum):
     KIS = "kis"
     DART = "dart"
     NAVER_NEWS = "naver_news"
@@ -45,6 +45,29 @@ class DataSource(str, Enum):
     FRED = "fred"
 
 
+# Event type per KIS data_type, and per non-KIS source
+_KIS_EVENT_TYPES = {
+    "tick": CollectorEventType.PRICE_TICK,
+    "orderbook": CollectorEventType.ORDERBOOK_SNAPSHOT,
+    "daily_ohlcv": CollectorEventType.DAILY_OHLCV,
+    "minute_candle": CollectorEventType.MINUTE_CANDLES,
+}
+_SOURCE_EVENT_TYPES = {
+    DataSource.DART: CollectorEventType.FINANCIAL_STATEMENT_UPDATE,
+    DataSource.NAVER_NEWS: CollectorEventType.NEWS_ARTICLE,
+    DataSource.BOK: CollectorEventType.MACRO_INDICATOR_UPDATE,
+    DataSource.FRED: CollectorEventType.MACRO_INDICATOR_UPDATE,
+}
+
+# Fixed-interval schedules; DAILY and WEEKLY anchor to wall-clock times
+_FREQUENCY_INTERVALS = {
+    CollectionFrequency.MINUTE_1: timedelta(minutes=1),
+    CollectionFrequency.MINUTE_5: timedelta(minutes=5),
+    CollectionFrequency.MINUTE_15: timedelta(minutes=15),
+    CollectionFrequency.HOURLY: timedelta(hours=1),
+}
+
+
 @dataclass
 class CollectionTask:
     id: str
@@ -125,8 +148,7 @@ class CollectorAgent:
     async def start(self):
         self._running = True
         
-        for collector in self._collectors.values():
-            await collector.start()
+        await asyncio.gather(*(c.start() for c in self._collectors.values()))
         
         self._scheduler_task = asyncio.create_task(self._run_scheduler())
         
@@ -148,8 +170,7 @@ class CollectorAgent:
             except asyncio.CancelledError:
                 pass
         
-        for collector in self._collectors.values():
-            await collector.stop()
+        await asyncio.gather(*(c.stop() for c in self._collectors.values()))
         
         logger.info("Collector Agent stopped")
         
@@ -182,22 +203,8 @@ class CollectorAgent:
     
     def _get_event_type_for_data(self, data: CollectedData) -> CollectorEventType:
         if data.source == DataSource.KIS:
-            if data.data_type == "tick":
-                return CollectorEventType.PRICE_TICK
-            elif data.data_type == "orderbook":
-                return CollectorEventType.ORDERBOOK_SNAPSHOT
-            elif data.data_type == "daily_ohlcv":
-                return CollectorEventType.DAILY_OHLCV
-            elif data.data_type == "minute_candle":
-                return CollectorEventType.MINUTE_CANDLES
-        elif data.source == DataSource.DART:
-            return CollectorEventType.FINANCIAL_STATEMENT_UPDATE
-        elif data.source == DataSource.NAVER_NEWS:
-            return CollectorEventType.NEWS_ARTICLE
-        elif data.source in (DataSource.BOK, DataSource.FRED):
-            return CollectorEventType.MACRO_INDICATOR_UPDATE
-        
-        return CollectorEventType.DAILY_OHLCV
+            return _KIS_EVENT_TYPES.get(data.data_type, CollectorEventType.DAILY_OHLCV)
+        return _SOURCE_EVENT_TYPES.get(data.source, CollectorEventType.DAILY_OHLCV)
     
     async def _run_scheduler(self):
         while self._running:
@@ -253,15 +260,11 @@ class CollectorAgent:
     def _calculate_next_run(self, frequency: CollectionFrequency) -> datetime:
         now = datetime.now()
         
+        interval = _FREQUENCY_INTERVALS.get(frequency)
+        if interval is not None:
+            return now + interval
+        
         match frequency:
-            case CollectionFrequency.MINUTE_1:
-                return now + timedelta(minutes=1)
-            case CollectionFrequency.MINUTE_5:
-                return now + timedelta(minutes=5)
-            case CollectionFrequency.MINUTE_15:
-                return now + timedelta(minutes=15)
-            case CollectionFrequency.HOURLY:
-                return now + timedelta(hours=1)
             case CollectionFrequency.DAILY:
                 next_run = now.replace(hour=15, minute=40, second=0, microsecond=0)
                 if now.hour >= 15:
@@ -19,6 +19,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 from core.event_bus import Event, EventBus
 from core.events import EventTypes
 
@@ -80,17 +82,16 @@ class PortfolioManager:
         self._max_sector_pct = self.config.get("max_sector_pct", 0.30)
         self._cash_reserve_pct = self.config.get("cash_reserve_pct", 0.10)
         self._rebalance_threshold = self.config.get("rebalance_threshold", 0.05)
+        
+        # Columnar view of positions, rebuilt lazily after each portfolio update
+        self._positions_arrays: dict[str, np.ndarray] | None = None
     
     async def start(self):
         self._running = True
         await self._load_portfolio()
         logger.info("Portfolio Manager started")
         
-        await self.event_bus.publish(Event(
-            type=EventTypes.PORTFOLIO_UPDATED,
-            payload={"message": "Portfolio Manager started"},
-            source="portfolio_manager",
-        ))
+        await self._publish_snapshot()
     
     async def stop(self):
         self._running = False
@@ -106,8 +107,10 @@ class PortfolioManager:
                 pos.unrealized_pnl = (price - pos.avg_price) * pos.quantity
         
         self._update_portfolio_value()
+        await self._publish_snapshot()
     
     def _update_portfolio_value(self):
+        self._positions_arrays = None
         total_market_value = sum(p.market_value for p in self._portfolio.positions.values())
         self._portfolio.total_value = self._portfolio.cash + total_market_value
         
@@ -310,6 +313,22 @@ class PortfolioManager:
                     del self._portfolio.positions[order.symbol]
         
         self._update_portfolio_value()
+        await self._publish_snapshot()
+    
+    async def _publish_snapshot(self):
+        """Publish the full position set; subscribers replace their view with it"""
+        await self.event_bus.publish(Event(
+            type=EventTypes.PORTFOLIO_UPDATED,
+            payload={
+                "total_value": self._portfolio.total_value,
+                "cash": self._portfolio.cash,
+                "positions": {
+                    symbol: {"market_value": pos.market_value}
+                    for symbol, pos in self._portfolio.positions.items()
+                },
+            },
+            source="portfolio_manager",
+        ))
     
     async def _load_portfolio(self):
         pass
@@ -323,6 +342,18 @@ class PortfolioManager:
     def get_position(self, symbol: str) -> Position | None:
         return self._portfolio.positions.get(symbol)
     
+    def get_positions_arrays(self) -> dict[str, np.ndarray]:
+        if self._positions_arrays is None:
+            positions = self._portfolio.positions.values()
+            n = len(self._portfolio.positions)
+            self._positions_arrays = {
+                "symbol": np.array([p.symbol for p in positions], dtype=object),
+                "quantity": np.fromiter((p.quantity for p in positions), dtype=np.int64, count=n),
+                "market_value": np.fromiter((p.market_value for p in positions), dtype=np.float64, count=n),
+                "weight": np.fromiter((p.weight for p in positions), dtype=np.float64, count=n),
+            }
+        return self._positions_arrays
+    
     def get_status(self) -> dict[str, Any]:
         return {
             "running": self._running,
@@ -0,0 +1,61 @@
+"""
+API Response Types
+
+msgspec-backed response class and the DTOs returned by the HTTP API.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import msgspec
+import polars as pl
+from fastapi.responses import JSONResponse
+
+from core.models import OHLCVFrame
+
+# Decimals are written as JSON numbers, matching the previous float output
+_ENC = msgspec.json.Encoder(decimal_format="number")
+
+
+class MsgspecResponse(JSONResponse):
+    """JSON response encoded by msgspec instead of json.dumps"""
+
+    def render(self, content: Any) -> bytes:
+        return _ENC.encode(content)
+
+
+class CycleResultDTO(msgspec.Struct):
+    success: bool
+    signals_generated: int
+    trades_executed: int
+    duration_seconds: float
+
+
+# state/status fields take str-valued enums as-is; msgspec encodes them by value
+class HealthDTO(msgspec.Struct):
+    status: str
+    started_at: datetime | None = None
+    last_cycle: bool | None = None
+
+
+class SystemStatusDTO(msgspec.Struct):
+    state: str
+    started_at: datetime | None
+    last_cycle: CycleResultDTO | None
+    errors: list[str]
+
+
+def encode_ohlcv(symbol: str, frame: OHLCVFrame) -> bytes:
+    """Encode OHLCV bars as {"symbol": ..., "data": [row, ...]} JSON"""
+    df = pl.DataFrame({
+        "time": frame.time,
+        "open": frame.open,
+        "high": frame.high,
+        "low": frame.low,
+        "close": frame.close,
+        "volume": frame.volume,
+    }).with_columns(pl.col("time").dt.strftime("%Y-%m-%dT%H:%M:%S"))
+    rows = df.write_json().encode()
+    return b'{"symbol":' + _ENC.encode(symbol) + b',"data":' + rows + b"}"
@@ -1,12 +1,20 @@
 import logging
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
 
 from broker.kis_client import get_kis_client
 from core.models import Portfolio, Holding
 
 logger = logging.getLogger("account")
 
+_ZERO = Decimal("0")
+_EMPTY = (0, "0", None, "")
+
+
+def _d(value) -> Decimal:
+    # Zero/empty fields are common in KIS balance rows; skip the str parse for them
+    return _ZERO if value in _EMPTY else Decimal(str(value))
+
 
 class AccountService:
     def __init__(self):
@@ -19,24 +27,24 @@ class AccountService:
         balance = self._client.get_balance()
         holdings = []
         
-        total_value = Decimal(str(balance.get("tot_evlu_amt", 0)))
-        cash = Decimal(str(balance.get("cash", 0)))
+        total_value = _d(balance.get("tot_evlu_amt"))
+        cash = _d(balance.get("cash"))
         
         for item in balance.get("holdings", []):
             holding = Holding(
                 symbol=item.get("stk_cd", ""),
                 name=item.get("stk_nm", ""),
                 quantity=int(item.get("hold_qty", 0)),
-                avg_price=Decimal(str(item.get("pchs_avg_pric", 0))),
-                current_price=Decimal(str(item.get("cur_pr", 0))),
-                market_value=Decimal(str(item.get("evlu_amt", 0))),
-                unrealized_pnl=Decimal(str(item.get("evlu_pnl", 0))),
+                avg_price=_d(item.get("pchs_avg_pric")),
+                current_price=_d(item.get("cur_pr")),
+                market_value=_d(item.get("evlu_amt")),
+                unrealized_pnl=_d(item.get("evlu_pnl")),
                 unrealized_pnl_pct=float(item.get("evlu_pnl_rate", 0)),
             )
             holdings.append(holding)
         
         invested = total_value - cash
-        daily_pnl = Decimal(str(balance.get("today_pnl", 0)))
+        daily_pnl = _d(balance.get("today_pnl"))
         daily_pnl_pct = float(balance.get("today_pnl_rate", 0))
         
         return Portfolio(
@@ -55,11 +63,6 @@ class AccountService:
         return self._client.get_today_executions()
 
 
-_account_service: Optional[AccountService] = None
-
-
+@lru_cache(maxsize=1)
 def get_account_service() -> AccountService:
-    global _account_service
-    if _account_service is None:
-        _account_service = AccountService()
-    return _account_service
+    return AccountService()
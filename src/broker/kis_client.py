@@ -1,14 +1,14 @@
 from typing import Optional
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
+import asyncio
 import logging
 
+import httpx
+
 try:
-    import pykis
-    from pykis import KIS, Order, Market, Crypto
-    from pykis.api.market import KISMarket
-    from pykis.api.order import KISOrder
-    from pykis.types import OrderType, OrderSide, TimeInForce
+    from pykis import KIS, Market
     PYKIS_AVAILABLE = True
 except ImportError:
     PYKIS_AVAILABLE = False
@@ -17,6 +17,25 @@ from core.config import get_settings, get_kis_credentials
 
 logger = logging.getLogger("kis_client")
 
+_TYPE_MAP = {
+    "MARKET": "01",
+    "LIMIT": "00",
+    "STOP_LIMIT": "03",
+}
+_LIVE_TR_IDS = {"BUY": "TTTC0802U", "SELL": "TTTC0801U"}
+_PAPER_TR_IDS = {"BUY": "VTTC0802U", "SELL": "VTTC0801U"}
+
+
+def _parse_account_no(account_no: str) -> tuple[str, str]:
+    """Split a KIS account number into (CANO, ACNT_PRDT_CD)
+    
+    Accepts "12345678-01", "1234567801", or "12345678" (product code 01).
+    """
+    digits = account_no.replace("-", "")
+    if not digits.isdigit() or len(digits) not in (8, 10):
+        raise ValueError(f"Invalid KIS account number: {account_no!r}")
+    return digits[:8], digits[8:] or "01"
+
 
 class KISClient:
     def __init__(self):
@@ -32,17 +51,55 @@ class KISClient:
             account_no=creds.account_no,
             is_paper=(settings.app.env == "paper"),
         )
+        self._market = Market(self._kis)
         self._is_paper = settings.app.env == "paper"
+        self._order_tr_ids = _PAPER_TR_IDS if self._is_paper else _LIVE_TR_IDS
+        self._app_key = creds.app_key
+        self._app_secret = creds.app_secret
+        self._cano, self._account_product_code = _parse_account_no(creds.account_no)
+        self._access_token: Optional[str] = None
         self._token_expires: Optional[datetime] = None
+        # Concurrent place_order calls share one token fetch; KIS rate-limits issuance
+        self._token_lock = asyncio.Lock()
+        
+        # Shared connection pool for direct KIS REST calls; keeps the TLS
+        # session alive across orders instead of reconnecting per request.
+        self._http = httpx.AsyncClient(
+            base_url=settings.kis.base_url,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10),
+            timeout=10.0,
+        )
         logger.info(f"KIS Client initialized (paper={self._is_paper})")
 
     async def ensure_token(self):
+        """Fetch the bearer token used by the direct REST calls
+
+        pykis-backed methods keep refreshing their own token via get_token().
+        """
         if self._token_expires and datetime.now() < self._token_expires:
             return
         
-        self._kis.get_token()
-        self._token_expires = datetime.now() + timedelta(hours=23)
-        logger.info("KIS token refreshed")
+        async with self._token_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._token_expires and datetime.now() < self._token_expires:
+                return
+            
+            response = await self._http.post(
+                "/oauth2/tokenP",
+                json={
+                    "grant_type": "client_credentials",
+                    "appkey": self._app_key,
+                    "appsecret": self._app_secret,
+                },
+            )
+            response.raise_for_status()
+            self._access_token = response.json()["access_token"]
+            self._token_expires = datetime.now() + timedelta(hours=23)
+            logger.info("KIS token refreshed")
+
+    async def close(self):
+        await self._http.aclose()
 
     def get_account_info(self) -> dict:
         self._kis.get_token()
@@ -69,8 +126,7 @@ class KISClient:
         limit: int = 100,
     ) -> list[dict]:
         self._kis.get_token()
-        market = Market(self._kis)
-        return market.ohlcv(
+        return self._market.ohlcv(
             symbol=symbol,
             timeframe=timeframe,
             start_date=start_date,
@@ -80,45 +136,47 @@ class KISClient:
 
     def get_current_price(self, symbol: str) -> Decimal:
         self._kis.get_token()
-        market = Market(self._kis)
-        price = market.current_price(symbol)
+        price = self._market.current_price(symbol)
         return Decimal(str(price))
 
     def get_orderbook(self, symbol: str) -> dict:
         self._kis.get_token()
-        market = Market(self._kis)
-        return market.orderbook(symbol)
+        return self._market.orderbook(symbol)
 
-    def place_order(
+    async def place_order(
         self,
         symbol: str,
         side: str,
         order_type: str,
         quantity: int,
         price: Optional[Decimal] = None,
-        order_type_detail: str = "0",
     ) -> dict:
-        self._kis.get_token()
-        
-        side_map = {"BUY": "buy", "SELL": "sell"}
-        type_map = {
-            "MARKET": "01",
-            "LIMIT": "00",
-            "STOP_LIMIT": "03",
-        }
+        await self.ensure_token()
         
-        order = Order(
-            symbol=symbol,
-            side=side_map.get(side, "buy"),
-            order_type_code=type_map.get(order_type, "01"),
-            order_type_detail=order_type_detail,
-            quantity=quantity,
-            price=str(price) if price else None,
+        response = await self._http.post(
+            "/uapi/domestic-stock/v1/trading/order-cash",
+            headers={
+                "authorization": f"Bearer {self._access_token}",
+                "appkey": self._app_key,
+                "appsecret": self._app_secret,
+                "tr_id": self._order_tr_ids.get(side, self._order_tr_ids["BUY"]),
+            },
+            json={
+                "CANO": self._cano,
+                "ACNT_PRDT_CD": self._account_product_code,
+                "PDNO": symbol,
+                "ORD_DVSN": _TYPE_MAP.get(order_type, "01"),
+                "ORD_QTY": str(quantity),
+                "ORD_UNPR": str(price) if price else "0",
+            },
         )
+        response.raise_for_status()
+        body = response.json()
+        if body.get("rt_cd") != "0":
+            raise RuntimeError(f"KIS order rejected: {body.get('msg1', '')}")
         
-        result = self._kis.Order.order(order)
-        logger.info(f"Order placed: {side} {quantity} {symbol} @ {price}")
-        return result
+        logger.info("Order placed: %s %s %s @ %s", side, quantity, symbol, price)
+        return body.get("output", {})
 
     def cancel_order(self, order_no: str, order_id: str) -> dict:
         self._kis.get_token()
@@ -139,11 +197,6 @@ class KISClient:
         return self._kis.Order.detail(order_no)
 
 
-_kis_client: Optional[KISClient] = None
-
-
+@lru_cache(maxsize=1)
 def get_kis_client() -> KISClient:
-    global _kis_client
-    if _kis_client is None:
-        _kis_client = KISClient()
-    return _kis_client
+    return KISClient()
@@ -1,13 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
 import logging
 
+import numpy as np
+
 from broker.kis_client import get_kis_client
-from core.models import OHLCV, OrderbookSnapshot
+from core.models import OHLCV, OHLCVFrame, OrderbookSnapshot
 
 logger = logging.getLogger("market_data")
 
+def _yyyymmdd(d: datetime) -> str:
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
 
 class MarketDataService:
     def __init__(self):
@@ -21,31 +26,32 @@ class MarketDataService:
         symbol: str,
         timeframe: str = "D",
         days: int = 100,
-    ) -> list[OHLCV]:
+    ) -> OHLCVFrame:
         end_date = datetime.now()
-        start_date = end_date.replace(day=end_date.day - days)
+        start_date = end_date - timedelta(days=days)
         
         data = self._client.get_ohlcv(
             symbol=symbol,
             timeframe=timeframe,
-            start_date=start_date.strftime("%Y%m%d"),
+            start_date=_yyyymmdd(start_date),
             limit=days,
         )
         
-        ohlcvs = []
-        for item in data:
-            ohlcvs.append(OHLCV(
-                time=datetime.strptime(item.get("stk_cd_mkt_dt", ""), "%Y%m%d"),
-                symbol=item.get("stk_cd", ""),
-                open=Decimal(str(item.get("oprc", 0))),
-                high=Decimal(str(item.get("hgpr", 0))),
-                low=Decimal(str(item.get("lwpr", 0))),
-                close=Decimal(str(item.get("clpr", 0))),
-                volume=int(item.get("vol", 0)),
-                timeframe=timeframe,
-            ))
+        n = len(data)
+        dates = [item.get("stk_cd_mkt_dt", "") for item in data]
         
-        return ohlcvs
+        return OHLCVFrame(
+            symbol=symbol,
+            timeframe=timeframe,
+            time=np.array(
+                [f"{d[:4]}-{d[4:6]}-{d[6:8]}" for d in dates], dtype="datetime64[D]"
+            ).astype("datetime64[ns]"),
+            open=np.fromiter((float(item.get("oprc", 0)) for item in data), np.float64, n),
+            high=np.fromiter((float(item.get("hgpr", 0)) for item in data), np.float64, n),
+            low=np.fromiter((float(item.get("lwpr", 0)) for item in data), np.float64, n),
+            close=np.fromiter((float(item.get("clpr", 0)) for item in data), np.float64, n),
+            volume=np.fromiter((int(item.get("vol", 0)) for item in data), np.int64, n),
+        )
 
     async def get_minute_candles(
         self,
@@ -83,14 +89,17 @@ class MarketDataService:
     async def get_orderbook(self, symbol: str) -> OrderbookSnapshot:
         data = self._client.get_orderbook(symbol)
         
-        bid_prices, bid_sizes = [], []
-        ask_prices, ask_sizes = [], []
+        bid_prices = np.empty(5, dtype=np.int64)
+        bid_sizes = np.empty(5, dtype=np.int64)
+        ask_prices = np.empty(5, dtype=np.int64)
+        ask_sizes = np.empty(5, dtype=np.int64)
         
-        for i in range(1, 6):
-            bid_prices.append(Decimal(str(data.get(f"bid_p{i}", 0))))
-            bid_sizes.append(int(data.get(f"bid_q{i}", 0)))
-            ask_prices.append(Decimal(str(data.get(f"ask_p{i}", 0))))
-            ask_sizes.append(int(data.get(f"ask_q{i}", 0)))
+        for i in range(5):
+            level = i + 1
+            bid_prices[i] = int(data.get(f"bid_p{level}", 0))
+            bid_sizes[i] = int(data.get(f"bid_q{level}", 0))
+            ask_prices[i] = int(data.get(f"ask_p{level}", 0))
+            ask_sizes[i] = int(data.get(f"ask_q{level}", 0))
         
         return OrderbookSnapshot(
             time=datetime.now(),
@@ -102,11 +111,6 @@ class MarketDataService:
         )
 
 
-_market_data_service: Optional[MarketDataService] = None
-
-
+@lru_cache(maxsize=1)
 def get_market_data_service() -> MarketDataService:
-    global _market_data_service
-    if _market_data_service is None:
-        _market_data_service = MarketDataService()
-    return _market_data_service
+    return MarketDataService()
@@ -1,8 +1,7 @@
 import logging
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
-from uuid import UUID, uuid4
+from functools import lru_cache
 
 from broker.kis_client import get_kis_client
 from core.models import ApprovedOrder, OrderExecution
@@ -19,13 +18,12 @@ class OrderExecutor:
 
     async def execute(self, order: ApprovedOrder) -> OrderExecution:
         execution = OrderExecution(
-            id=uuid4(),
             order_id=order.id,
             status=OrderStatus.SUBMITTED,
         )
         
         try:
-            result = self._client.place_order(
+            result = await self._client.place_order(
                 symbol=order.symbol,
                 side=order.side.value,
                 order_type=order.order_type.value,
@@ -41,9 +39,9 @@ class OrderExecutor:
                 payload=execution,
                 source="order_executor",
             )
-            await self._event_bus.publish(event)
+            self._event_bus.publish_nowait(event)
             
-            logger.info(f"Order executed: {order.side.value} {order.quantity} {order.symbol}")
+            logger.info("Order executed: %s %s %s", order.side.value, order.quantity, order.symbol)
             
         except Exception as e:
             execution.status = OrderStatus.FAILED
@@ -54,9 +52,9 @@ class OrderExecutor:
                 payload=execution,
                 source="order_executor",
             )
-            await self._event_bus.publish(event)
+            self._event_bus.publish_nowait(event)
             
-            logger.error(f"Order failed: {order.symbol} - {e}")
+            logger.error("Order failed: %s - %s", order.symbol, e)
         
         return execution
 
@@ -65,11 +63,6 @@ class OrderExecutor:
         return result
 
 
-_order_executor: Optional[OrderExecutor] = None
-
-
+@lru_cache(maxsize=1)
 def get_order_executor() -> OrderExecutor:
-    global _order_executor
-    if _order_executor is None:
-        _order_executor = OrderExecutor()
-    return _order_executor
+    return OrderExecutor()
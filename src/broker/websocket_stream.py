@@ -1,9 +1,18 @@
 import asyncio
+import contextlib
 import json
 import logging
+import sys
 from datetime import datetime
 from decimal import Decimal
-from typing import Callable, Optional
+from functools import lru_cache
+from typing import Callable
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
 
 from core.config import get_settings
 from core.event_bus import get_event_bus, Event
@@ -19,7 +28,13 @@ class WebSocketClient:
         self._subscriptions: set[str] = set()
         self._reconnect_delay = 1
         self._max_reconnect_delay = 60
-        
+        # Reused across messages so the parser's internal buffer is allocated once
+        self._json_parser = simdjson.Parser() if SIMDJSON_AVAILABLE else None
+        # Decouples socket reads from event-bus fan-out so slow subscribers
+        # never stall the receive loop
+        self._tick_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+        self._publisher_task: asyncio.Task | None = None
+
     async def connect(self):
         import websockets
         
@@ -38,7 +53,7 @@ class WebSocketClient:
                 await self._receive_loop()
                 
             except Exception as e:
-                logger.error(f"WebSocket error: {e}")
+                logger.error("WebSocket error: %s", e)
                 await asyncio.sleep(self._reconnect_delay)
                 self._reconnect_delay = min(self._reconnect_delay * 2, self._max_reconnect_delay)
 
@@ -56,8 +71,15 @@ class WebSocketClient:
         await self._ws.send(json.dumps(auth_data))
 
     async def _resubscribe_all(self):
-        for symbol in self._subscriptions:
-            await self._subscribe(symbol)
+        if not self._ws or not self._subscriptions:
+            return
+        
+        # KIS accepts one symbol per subscribe frame, so encode every frame up
+        # front and push them back-to-back onto the socket
+        frames = [self._subscription_frame(symbol, "S") for symbol in self._subscriptions]
+        for frame in frames:
+            await self._ws.send(frame)
+        logger.info("Resubscribed to %d symbols", len(frames))
 
     async def subscribe_price(self, symbol: str):
         self._subscriptions.add(symbol)
@@ -67,54 +89,79 @@ class WebSocketClient:
         self._subscriptions.discard(symbol)
         await self._unsubscribe(symbol)
 
-    async def _subscribe(self, symbol: str):
-        if not self._ws:
-            return
-        
+    def _subscription_frame(self, symbol: str, action: str) -> str:
         msg = {
             "mkt_tp": "0",
             "symb": symbol,
-            "type": "S",
+            "type": action,
         }
-        await self._ws.send(json.dumps(msg))
-        logger.info(f"Subscribed to {symbol}")
+        return json.dumps(msg)
+
+    async def _subscribe(self, symbol: str):
+        if not self._ws:
+            return
+        
+        await self._ws.send(self._subscription_frame(symbol, "S"))
+        logger.debug("Subscribed to %s", symbol)
 
     async def _unsubscribe(self, symbol: str):
         if not self._ws:
             return
         
-        msg = {
-            "mkt_tp": "0",
-            "symb": symbol,
-            "type": "U",
-        }
-        await self._ws.send(json.dumps(msg))
-        logger.info(f"Unsubscribed from {symbol}")
+        await self._ws.send(self._subscription_frame(symbol, "U"))
+        logger.debug("Unsubscribed from %s", symbol)
 
     async def _receive_loop(self):
-        event_bus = get_event_bus()
-        
         async for message in self._ws:
             try:
-                data = json.loads(message)
+                price_data = self._decode_message(message)
                 
-                if "evt_cd" in data:
-                    if data["evt_cd"] == "5001":
-                        price_data = self._parse_price(data)
-                        event = Event(
-                            type=EventTypes.MARKET_DATA,
-                            payload=price_data,
-                            source="websocket",
-                        )
-                        await event_bus.publish(event)
+                if price_data is not None:
+                    event = Event(
+                        type=EventTypes.MARKET_DATA,
+                        payload=price_data,
+                        source="websocket",
+                    )
+                    self._enqueue(event)
                         
             except Exception as e:
-                logger.error(f"Error parsing message: {e}")
+                logger.error("Error parsing message: %s", e)
+
+    def _enqueue(self, event: Event):
+        try:
+            self._tick_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Drop the stalest tick rather than block the socket
+            self._tick_queue.get_nowait()
+            self._tick_queue.put_nowait(event)
+            logger.warning("Tick queue full, dropped oldest event")
+
+    async def _publish_loop(self):
+        event_bus = get_event_bus()
+        
+        while True:
+            event = await self._tick_queue.get()
+            try:
+                await event_bus.publish(event)
+            except Exception as e:
+                logger.error("Error publishing tick: %s", e)
+
+    def _decode_message(self, message) -> dict | None:
+        # The parsed document must not outlive this call: simdjson refuses to
+        # reuse a parser while proxies into its previous document still exist.
+        if self._json_parser is not None:
+            data = self._json_parser.parse(message)
+        else:
+            data = json.loads(message)
+        
+        if data.get("evt_cd") == "5001":
+            return self._parse_price(data)
+        return None
 
     def _parse_price(self, data: dict) -> dict:
         return {
             "type": MarketEventType.PRICE_UPDATE,
-            "symbol": data.get("symb", ""),
+            "symbol": sys.intern(data.get("symb", "")),
             "price": Decimal(str(data.get("cur_pr", 0))),
             "volume": int(data.get("vol", 0)),
             "timestamp": datetime.now(),
@@ -122,21 +169,22 @@ class WebSocketClient:
 
     async def start(self):
         self._running = True
+        self._publisher_task = asyncio.create_task(self._publish_loop())
         asyncio.create_task(self.connect())
         logger.info("WebSocket client started")
 
     async def stop(self):
         self._running = False
+        if self._publisher_task:
+            self._publisher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._publisher_task
+            self._publisher_task = None
         if self._ws:
             await self._ws.close()
         logger.info("WebSocket client stopped")
 
 
-_websocket_client: Optional[WebSocketClient] = None
-
-
+@lru_cache(maxsize=1)
 def get_websocket_client() -> WebSocketClient:
-    global _websocket_client
-    if _websocket_client is None:
-        _websocket_client = WebSocketClient()
-    return _websocket_client
+    return WebSocketClient()
@@ -99,16 +99,12 @@ class AllSettings:
         self.database.url = self.database.url.replace("${DB_PASSWORD}", password)
 
 
-_settings: AllSettings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> AllSettings:
-    global _settings
-    if _settings is None:
-        base_settings = Settings()
-        _settings = AllSettings()
-        _settings.update_database_url(base_settings.db_password)
-    return _settings
+    base_settings = Settings()
+    settings = AllSettings()
+    settings.update_database_url(base_settings.db_password)
+    return settings
 
 
 def get_kis_credentials() -> Settings:
@@ -3,8 +3,10 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Callable, Coroutine
-from uuid import uuid4
+
+from core.ids import pooled_uuid4
 
 logger = logging.getLogger("event_bus")
 
@@ -15,37 +17,49 @@ class Event:
     payload: Any
     source: str
     timestamp: datetime = field(default_factory=datetime.now)
-    correlation_id: str = field(default_factory=lambda: str(uuid4()))
+    correlation_id: str = field(default_factory=lambda: str(pooled_uuid4()))
 
 
 class EventBus:
     def __init__(self):
         self._handlers: dict[str, list[Callable[..., Coroutine]]] = defaultdict(list)
         self._log = logger
+        self._pending: set[asyncio.Task] = set()
 
     def subscribe(self, event_type: str, handler: Callable[..., Coroutine]):
         self._handlers[event_type].append(handler)
         self._log.info(f"Subscribed {handler.__name__} to {event_type}")
 
     async def publish(self, event: Event):
-        self._log.info(f"[{event.source}] → {event.type}")
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info("[%s] → %s", event.source, event.type)
         handlers = self._handlers.get(event.type, [])
         await asyncio.gather(
             *(h(event) for h in handlers),
             return_exceptions=True
         )
 
+    def publish_nowait(self, event: Event):
+        """Schedule handlers without waiting for them to finish"""
+        for h in self._handlers.get(event.type, ()):
+            task = asyncio.create_task(h(event))
+            self._pending.add(task)
+            task.add_done_callback(self._on_handler_done)
+
+    def _on_handler_done(self, task: asyncio.Task):
+        self._pending.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self._log.error("Handler failed", exc_info=exc)
+
     async def publish_and_wait(self, event: Event) -> list[Any]:
         handlers = self._handlers.get(event.type, [])
         results = await asyncio.gather(*(h(event) for h in handlers), return_exceptions=True)
         return [r for r in results if not isinstance(r, Exception)]
 
 
-_event_bus: EventBus | None = None
-
-
+@lru_cache(maxsize=1)
 def get_event_bus() -> EventBus:
-    global _event_bus
-    if _event_bus is None:
-        _event_bus = EventBus()
-    return _event_bus
+    return EventBus()
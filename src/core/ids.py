@@ -0,0 +1,39 @@
+"""
+Identifier generation
+
+uuid4 values sliced from a bulk os.urandom pool, one syscall per 4096 IDs
+instead of one per ID. The pool is dropped in forked children so worker
+processes never hand out the parent's unused IDs.
+"""
+
+import os
+import threading
+from uuid import UUID
+
+_UUID_POOL_SIZE = 4096
+_uuid_lock = threading.Lock()
+_uuid_pool = b""
+_uuid_offset = 0
+
+
+def pooled_uuid4() -> UUID:
+    global _uuid_pool, _uuid_offset
+    with _uuid_lock:
+        if _uuid_offset >= len(_uuid_pool):
+            _uuid_pool = os.urandom(16 * _UUID_POOL_SIZE)
+            _uuid_offset = 0
+        raw = _uuid_pool[_uuid_offset:_uuid_offset + 16]
+        _uuid_offset += 16
+    # version=4 sets the version and RFC 4122 variant bits
+    return UUID(bytes=raw, version=4)
+
+
+def _reset_after_fork():
+    global _uuid_lock, _uuid_pool, _uuid_offset
+    _uuid_lock = threading.Lock()
+    _uuid_pool = b""
+    _uuid_offset = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,8 +1,11 @@
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+import numpy as np
 
 from core.events import (
     OrderSide,
@@ -12,9 +15,26 @@ from core.events import (
     TimeInForce,
     MarketRegime,
 )
+from core.ids import pooled_uuid4
+
+
+# Timestamps are refreshed at most once per tick; model instances created
+# within the same millisecond share one datetime object.
+_NOW_TICK_NS = 1_000_000
+_now_mono_ns = 0
+_now_value: datetime | None = None
 
 
-@dataclass
+def _now_cached() -> datetime:
+    global _now_mono_ns, _now_value
+    mono = time.monotonic_ns()
+    if _now_value is None or mono - _now_mono_ns >= _NOW_TICK_NS:
+        _now_value = datetime.now()
+        _now_mono_ns = mono
+    return _now_value
+
+
+@dataclass(slots=True, frozen=True)
 class OHLCV:
     time: datetime
     symbol: str
@@ -26,7 +46,23 @@ class OHLCV:
     timeframe: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class OHLCVFrame:
+    """Column-oriented OHLCV bars, one array per field"""
+    symbol: str
+    timeframe: str
+    time: np.ndarray  # datetime64[ns]
+    open: np.ndarray  # float64
+    high: np.ndarray  # float64
+    low: np.ndarray  # float64
+    close: np.ndarray  # float64
+    volume: np.ndarray  # int64
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+@dataclass(slots=True, frozen=True)
 class TickData:
     time: datetime
     symbol: str
@@ -35,25 +71,32 @@ class TickData:
     side: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderbookLevel:
     price: Decimal
     size: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderbookSnapshot:
     time: datetime
     symbol: str
-    bid_prices: list[Decimal]
-    bid_sizes: list[int]
-    ask_prices: list[Decimal]
-    ask_sizes: list[int]
+    # int64 arrays, best level first; KRW prices are whole-won ticks
+    bid_prices: np.ndarray
+    bid_sizes: np.ndarray
+    ask_prices: np.ndarray
+    ask_sizes: np.ndarray
+
+    def as_decimal(self) -> tuple[list[Decimal], list[Decimal]]:
+        return (
+            [Decimal(p) for p in self.bid_prices.tolist()],
+            [Decimal(p) for p in self.ask_prices.tolist()],
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeSignal:
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=pooled_uuid4)
     symbol: str = ""
     direction: SignalDirection = SignalDirection.HOLD
     strength: float = 0.0
@@ -63,13 +106,13 @@ class TradeSignal:
     reasoning: str = ""
     max_position_pct: float = 0.0
     urgency: str = "THIS_WEEK"
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now_cached)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderProposal:
-    id: UUID = field(default_factory=uuid4)
-    signal_id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=pooled_uuid4)
+    signal_id: UUID = field(default_factory=pooled_uuid4)
     symbol: str = ""
     side: OrderSide = OrderSide.BUY
     order_type: OrderType = OrderType.MARKET
@@ -79,13 +122,13 @@ class OrderProposal:
     split_count: int = 1
     time_in_force: TimeInForce = TimeInForce.DAY
     reasoning: str = ""
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now_cached)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApprovedOrder:
-    id: UUID = field(default_factory=uuid4)
-    proposal_id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=pooled_uuid4)
+    proposal_id: UUID = field(default_factory=pooled_uuid4)
     symbol: str = ""
     side: OrderSide = OrderSide.BUY
     order_type: OrderType = OrderType.MARKET
@@ -93,13 +136,13 @@ class ApprovedOrder:
     price: Optional[Decimal] = None
     stop_price: Optional[Decimal] = None
     time_in_force: TimeInForce = TimeInForce.DAY
-    approved_at: datetime = field(default_factory=datetime.now)
+    approved_at: datetime = field(default_factory=_now_cached)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderExecution:
-    id: UUID = field(default_factory=uuid4)
-    order_id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=pooled_uuid4)
+    order_id: UUID = field(default_factory=pooled_uuid4)
     status: OrderStatus = OrderStatus.SUBMITTED
     kis_order_no: Optional[str] = None
     filled_quantity: int = 0
@@ -108,7 +151,7 @@ class OrderExecution:
     executed_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Holding:
     symbol: str
     name: str
@@ -120,7 +163,7 @@ class Holding:
     unrealized_pnl_pct: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     total_value: Decimal
     cash: Decimal
@@ -128,14 +171,14 @@ class Portfolio:
     daily_pnl: Decimal
     daily_pnl_pct: float
     holdings: list[Holding] = field(default_factory=list)
-    updated_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=_now_cached)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisReport:
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=pooled_uuid4)
     symbol: str = ""
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now_cached)
     technical_score: float = 0.0
     fundamental_score: float = 0.0
     sentiment_score: float = 0.0
@@ -145,9 +188,9 @@ class AnalysisReport:
     details: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NewsArticle:
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=pooled_uuid4)
     symbol: Optional[str] = None
     source: str = ""
     title: str = ""
@@ -155,10 +198,10 @@ class NewsArticle:
     url: str = ""
     sentiment_score: float = 0.0
     published_at: Optional[datetime] = None
-    analyzed_at: datetime = field(default_factory=datetime.now)
+    analyzed_at: datetime = field(default_factory=_now_cached)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MacroIndicator:
     indicator_name: str
     value: float
@@ -168,7 +211,7 @@ class MacroIndicator:
     date: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FinancialStatement:
     corp_code: str
     corp_name: str
@@ -0,0 +1,44 @@
+"""
+Tick Dispatcher
+
+Buffers incoming price ticks and releases them in batches, keeping only the
+latest tick per symbol so bursty symbols are processed once per flush.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+
+class TickDispatcher:
+    __slots__ = ("_buffer", "_batch_size", "_flush_interval", "_last_flush")
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        flush_interval_ms: float = 50.0,
+        max_buffered: int = 4096,
+    ):
+        self._buffer: deque[tuple[str, float, int]] = deque(maxlen=max_buffered)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000.0
+        self._last_flush = time.monotonic()
+
+    def dispatch(self, symbol: str, price: float, volume: int) -> bool:
+        """Buffer a tick; returns True when a flush is due"""
+        self._buffer.append((symbol, price, volume))
+        return (
+            len(self._buffer) >= self._batch_size
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        )
+
+    def drain(self) -> dict[str, tuple[float, int]]:
+        """Return the latest (price, volume) per symbol and clear the buffer"""
+        latest = {symbol: (price, volume) for symbol, price, volume in self._buffer}
+        self._buffer.clear()
+        self._last_flush = time.monotonic()
+        return latest
+
+    def __len__(self) -> int:
+        return len(self._buffer)
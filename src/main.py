@@ -8,12 +8,26 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
+from decimal import Decimal
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from agents.cio import EmergencyLevel
+from api.responses import (
+    CycleResultDTO,
+    HealthDTO,
+    MsgspecResponse,
+    SystemStatusDTO,
+    encode_ohlcv,
+)
+from broker.account import AccountService, get_account_service
+from broker.kis_client import get_kis_client
+from broker.market_data import MarketDataService, get_market_data_service
+from broker.order_executor import OrderExecutor, get_order_executor
 from core.config import get_settings
 from core.event_bus import EventBus
+from core.models import ApprovedOrder, OrderSide, OrderType
 from main_coordinator import MainCoordinator, SystemState
 
 
@@ -29,6 +43,33 @@ logger = logging.getLogger(__name__)
 event_bus: EventBus | None = None
 coordinator: MainCoordinator | None = None
 
+# Broker services are bound on first use, not at startup: building them needs
+# pykis and KIS credentials, which only the broker routes should depend on
+account_svc: AccountService | None = None
+market_data_svc: MarketDataService | None = None
+order_exec: OrderExecutor | None = None
+
+
+def _account_service() -> AccountService:
+    global account_svc
+    if account_svc is None:
+        account_svc = get_account_service()
+    return account_svc
+
+
+def _market_data_service() -> MarketDataService:
+    global market_data_svc
+    if market_data_svc is None:
+        market_data_svc = get_market_data_service()
+    return market_data_svc
+
+
+def _order_executor() -> OrderExecutor:
+    global order_exec
+    if order_exec is None:
+        order_exec = get_order_executor()
+    return order_exec
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -62,6 +103,7 @@ async def lifespan(app: FastAPI):
             "cycle_time": "09:00",
             "auto_start_cycle": True,
             "max_daily_trades": 10,
+            "max_concurrent_requests": 4,
             "portfolio": {
                 "max_position_pct": 0.10,
                 "cash_reserve_pct": 0.10,
@@ -87,15 +129,22 @@ async def lifespan(app: FastAPI):
     if coordinator:
         await coordinator.stop()
     
+    # Release the KIS HTTP/2 pool if a client was created
+    if get_kis_client.cache_info().currsize:
+        await get_kis_client().close()
+    
     logger.info("KIS AI Trader shutdown complete")
 
 
 # Create FastAPI app
+# Handlers wrap their payloads in MsgspecResponse themselves: FastAPI passes
+# Response objects through untouched, so jsonable_encoder never runs
 app = FastAPI(
     title="KIS AI Trader",
     description="AI-powered multi-agent stock trading system",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=MsgspecResponse,
 )
 
 app.add_middleware(
@@ -112,12 +161,13 @@ app.add_middleware(
 async def health_check():
     if coordinator:
         status = coordinator.get_status()
-        return {
-            "status": status.state.value,
-            "started_at": status.started_at.isoformat() if status.started_at else None,
-            "last_cycle": status.last_cycle.success if status.last_cycle else None,
-        }
-    return {"status": "initializing"}
+        last_cycle = status.last_cycle
+        return MsgspecResponse(HealthDTO(
+            status=status.state,
+            started_at=status.started_at,
+            last_cycle=last_cycle.success if last_cycle else None,
+        ))
+    return MsgspecResponse({"status": "initializing"})
 
 
 # System status
@@ -125,34 +175,35 @@ async def health_check():
 async def get_system_status():
     if coordinator:
         status = coordinator.get_status()
-        return {
-            "state": status.state.value,
-            "started_at": status.started_at.isoformat() if status.started_at else None,
-            "last_cycle": {
-                "success": status.last_cycle.success,
-                "signals_generated": status.last_cycle.signals_generated,
-                "trades_executed": status.last_cycle.trades_executed,
-                "duration_seconds": status.last_cycle.duration_seconds,
-            } if status.last_cycle else None,
-            "errors": status.errors,
-        }
-    return {"error": "System not initialized"}
+        last_cycle = status.last_cycle
+        return MsgspecResponse(SystemStatusDTO(
+            state=status.state,
+            started_at=status.started_at,
+            last_cycle=CycleResultDTO(
+                success=last_cycle.success,
+                signals_generated=last_cycle.signals_generated,
+                trades_executed=last_cycle.trades_executed,
+                duration_seconds=last_cycle.duration_seconds,
+            ) if last_cycle else None,
+            errors=status.errors,
+        ))
+    return MsgspecResponse({"error": "System not initialized"})
 
 
 # Portfolio status
 @app.get("/api/v1/portfolio")
 async def get_portfolio():
     if coordinator:
-        return coordinator.get_portfolio_status()
-    return {"error": "System not initialized"}
+        return MsgspecResponse(coordinator.get_portfolio_status())
+    return MsgspecResponse({"error": "System not initialized"})
 
 
 # Active signals
 @app.get("/api/v1/signals")
 async def get_signals():
     if coordinator:
-        return {"signals": coordinator.get_active_signals()}
-    return {"error": "System not initialized"}
+        return MsgspecResponse({"signals": coordinator.get_active_signals()})
+    return MsgspecResponse({"error": "System not initialized"})
 
 
 # Trigger daily cycle manually
@@ -162,19 +213,18 @@ async def trigger_daily_cycle():
         status = coordinator.get_status()
         if status.state == SystemState.RUNNING:
             await coordinator.run_daily_cycle()
-            return {"message": "Daily cycle triggered"}
-        return {"error": "System not running"}
-    return {"error": "System not initialized"}
+            return MsgspecResponse({"message": "Daily cycle triggered"})
+        return MsgspecResponse({"error": "System not running"})
+    return MsgspecResponse({"error": "System not initialized"})
 
 
 # Trigger emergency stop
 @app.post("/api/v1/emergency/stop")
 async def trigger_emergency_stop(reason: str = "Manual emergency stop"):
     if coordinator:
-        from agents.cio import EmergencyLevel
         await coordinator.trigger_emergency(EmergencyLevel.CRITICAL, reason)
-        return {"message": "Emergency stop triggered"}
-    return {"error": "System not initialized"}
+        return MsgspecResponse({"message": "Emergency stop triggered"})
+    return MsgspecResponse({"error": "System not initialized"})
 
 
 # Analyze symbol
@@ -183,58 +233,39 @@ async def analyze_symbol(symbol: str):
     if coordinator:
         signal = await coordinator.trigger_signal_generation(symbol)
         if signal:
-            return {
+            return MsgspecResponse({
                 "symbol": symbol,
                 "direction": signal.direction,
                 "strength": signal.strength,
                 "reasoning": signal.reasoning,
-            }
-        return {"symbol": symbol, "message": "No signal generated"}
-    return {"error": "System not initialized"}
+            })
+        return MsgspecResponse({"symbol": symbol, "message": "No signal generated"})
+    return MsgspecResponse({"error": "System not initialized"})
 
 
 # Get account info
 @app.get("/api/v1/account")
 async def get_account():
-    from broker.account import get_account_service
-    account = get_account_service()
-    portfolio = account.get_portfolio()
-    return {
-        "total_value": float(portfolio.total_value),
-        "cash": float(portfolio.cash),
-        "invested": float(portfolio.invested),
-    }
+    portfolio = _account_service().get_portfolio()
+    return MsgspecResponse({
+        "total_value": portfolio.total_value,
+        "cash": portfolio.cash,
+        "invested": portfolio.invested,
+    })
 
 
 # Get price
 @app.get("/api/v1/price/{symbol}")
 async def get_price(symbol: str):
-    from broker.market_data import get_market_data_service
-    service = get_market_data_service()
-    price = await service.get_current_price(symbol)
-    return {"symbol": symbol, "price": float(price)}
+    price = await _market_data_service().get_current_price(symbol)
+    return MsgspecResponse({"symbol": symbol, "price": price})
 
 
 # Get OHLCV data
-@app.get("/api/v1/ohlcv/{symbol}")
+@app.get("/api/v1/ohlcv/{symbol}", response_class=Response)
 async def get_ohlcv(symbol: str, timeframe: str = "D", days: int = 100):
-    from broker.market_data import get_market_data_service
-    service = get_market_data_service()
-    data = await service.get_ohlcv(symbol, timeframe, days)
-    return {
-        "symbol": symbol,
-        "data": [
-            {
-                "time": o.time.isoformat(),
-                "open": float(o.open),
-                "high": float(o.high),
-                "low": float(o.low),
-                "close": float(o.close),
-                "volume": o.volume,
-            }
-            for o in data
-        ],
-    }
+    frame = await _market_data_service().get_ohlcv(symbol, timeframe, days)
+    return Response(encode_ohlcv(symbol, frame), media_type="application/json")
 
 
 # Place order
@@ -246,11 +277,6 @@ async def place_order(
     quantity: int = 0,
     price: float | None = None,
 ):
-    from broker.order_executor import get_order_executor
-    from core.models import ApprovedOrder, OrderSide, OrderType
-    from decimal import Decimal
-    
-    executor = get_order_executor()
     order = ApprovedOrder(
         symbol=symbol,
         side=OrderSide(side),
@@ -259,12 +285,12 @@ async def place_order(
         price=Decimal(str(price)) if price else None,
     )
     
-    result = await executor.execute(order)
-    return {
-        "order_id": str(result.id),
-        "status": result.status.value,
+    result = await _order_executor().execute(order)
+    return MsgspecResponse({
+        "order_id": result.id,
+        "status": result.status,
         "kis_order_no": result.kis_order_no,
-    }
+    })
 
 
 if __name__ == "__main__":
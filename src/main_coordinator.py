@@ -16,20 +16,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
 from core.event_bus import Event, EventBus
-from core.events import EventTypes
+from core.events import CollectorEventType, EventTypes
+from core.tick_dispatch import TickDispatcher
 
 from agents.collector import CollectorAgent, create_collector_agent
 from agents.analyst import AnalystAgent
 from agents.strategist import StrategistAgent, StrategyType
 from agents.strategist.strategies.composite import CompositeStrategy
 from agents.portfolio import PortfolioManager
-from agents.cio import CIOAgent, EmergencyLevel
+from agents.cio import ApprovalStatus, CIOAgent, EmergencyLevel
 
 
 logger = logging.getLogger("main_coordinator")
@@ -73,6 +77,32 @@ class MainCoordinator:
     It coordinates all agents and manages the trading lifecycle.
     """
     
+    __slots__ = (
+        "event_bus",
+        "universe",
+        "config",
+        "_state",
+        "_started_at",
+        "_last_cycle_result",
+        "_errors",
+        "collector",
+        "analyst",
+        "strategist",
+        "portfolio_manager",
+        "cio",
+        "_event_subscriptions",
+        "_running",
+        "_cycle_task",
+        "_tick_queue",
+        "_tick_task",
+        "_tick_dispatcher",
+        "_report_cache",
+        "_report_ttl",
+        "_max_concurrency",
+        "_cycle_hour",
+        "_cycle_minute",
+    )
+    
     def __init__(
         self,
         event_bus: EventBus,
@@ -80,14 +110,15 @@ class MainCoordinator:
         config: dict[str, Any] | None = None,
     ):
         self.event_bus = event_bus
-        self.universe = universe
+        # Interned once so per-tick symbol hashing and compares hit the fast path
+        self.universe = tuple(sys.intern(symbol) for symbol in universe)
         self.config = config or {}
         
         # System state
         self._state = SystemState.INITIALIZING
         self._started_at: datetime | None = None
         self._last_cycle_result: CycleResult | None = None
-        self._errors: list[str] = []
+        self._errors: deque[str] = deque(maxlen=10)
         
         # Agents
         self.collector: CollectorAgent | None = None
@@ -100,6 +131,31 @@ class MainCoordinator:
         self._event_subscriptions: dict[str, list[callable]] = {}
         self._running = False
         self._cycle_task: asyncio.Task | None = None
+        
+        # Price ticks are queued and drained by _consume_ticks so a slow
+        # analyst never blocks the publisher
+        self._tick_queue: asyncio.Queue[Event] = asyncio.Queue(
+            maxsize=self.config.get("tick_queue_size", 4096)
+        )
+        self._tick_task: asyncio.Task | None = None
+        
+        # Coalesces bursts of price ticks into one analysis per symbol
+        self._tick_dispatcher = TickDispatcher(
+            batch_size=self.config.get("tick_batch_size", 64),
+            flush_interval_ms=self.config.get("tick_flush_interval_ms", 50),
+        )
+        
+        # Latest analysis report per symbol, reused while younger than the TTL
+        self._report_cache: dict[str, tuple[float, Any]] = {}
+        self._report_ttl = self.config.get("report_ttl_seconds", 300)
+        
+        # Caps concurrent per-symbol agent calls (KIS API rate limit)
+        self._max_concurrency = self.config.get("max_concurrent_requests", 4)
+        
+        # Run cycle at market open (9:00) or custom time
+        self._cycle_hour, self._cycle_minute = map(
+            int, self.config.get("cycle_time", "09:00").split(":")
+        )
     
     async def initialize(self):
         """Initialize all agents"""
@@ -110,7 +166,7 @@ class MainCoordinator:
             # Create agents
             self.collector = create_collector_agent(
                 event_bus=self.event_bus,
-                universe=self.universe,
+                universe=list(self.universe),
                 enable_realtime=self.config.get("enable_realtime", True),
             )
             
@@ -144,45 +200,80 @@ class MainCoordinator:
             logger.info("Main Coordinator initialized successfully")
             
         except Exception as e:
-            logger.error(f"Initialization failed: {e}", exc_info=True)
             self._state = SystemState.ERROR
-            self._errors.append(str(e))
+            await self._record_error("Initialization failed", e)
             raise
     
     def _subscribe_events(self):
         """Subscribe to events from other agents"""
-        
-        # Collector -> Analyst
-        async def on_price_tick(event: Event):
-            if self.analyst and self._state == SystemState.RUNNING:
-                symbol = event.payload.get("symbol")
-                if symbol:
-                    await self.analyst.analyze_symbol(symbol)
-        
-        # Analyst -> Strategist
-        async def on_analysis_report(event: Event):
-            if self.strategist and self._state == SystemState.RUNNING:
-                report = event.payload
-                if hasattr(report, "symbol"):
-                    await self.strategist.generate_signal(
-                        {"symbol": report.symbol, "technical": {}, "fundamental": {}, "sentiment": {}}
-                    )
-        
-        # Strategist -> Portfolio Manager
-        async def on_trade_signal(event: Event):
-            if self.portfolio_manager and self._state == SystemState.RUNNING:
-                signal = event.payload
-                proposals = await self.portfolio_manager.generate_order_proposals([signal])
-                for proposal in proposals[:3]:
-                    if self.cio:
-                        decision = await self.cio.review_order(proposal)
-                        if decision.status.value == "APPROVED":
-                            await self.portfolio_manager.execute_order(proposal)
-        
-        # Subscribe to EventBus
-        self.event_bus.subscribe(EventTypes.PRICE_TICK.value, on_price_tick)
-        self.event_bus.subscribe(EventTypes.ANALYSIS_REPORT.value, on_analysis_report)
-        self.event_bus.subscribe(EventTypes.TRADE_SIGNAL.value, on_trade_signal)
+        self.event_bus.subscribe(CollectorEventType.PRICE_TICK.value, self._on_price_tick)
+        self.event_bus.subscribe(EventTypes.ANALYSIS_REPORT, self._on_analysis_report)
+        self.event_bus.subscribe(EventTypes.TRADE_SIGNAL, self._on_trade_signal)
+    
+    async def _on_price_tick(self, event: Event):
+        """Collector -> Analyst (queued, see _consume_ticks)"""
+        try:
+            self._tick_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Drop the oldest tick; the newer one supersedes it anyway
+            self._tick_queue.get_nowait()
+            self._tick_queue.put_nowait(event)
+    
+    def _buffer_tick(self, event: Event) -> bool:
+        """Add a tick to the dispatcher; returns True when a flush is due"""
+        # A malformed tick must not take down the single _consume_ticks task
+        try:
+            payload = event.payload
+            symbol = payload.get("symbol")
+            if not symbol:
+                return False
+            return self._tick_dispatcher.dispatch(
+                symbol,
+                float(payload.get("price", 0)),
+                int(payload.get("volume", 0)),
+            )
+        except Exception:
+            logger.exception("Skipping malformed price tick: %r", event.payload)
+            return False
+    
+    async def _consume_ticks(self):
+        """Drain queued ticks in batches, analyzing each symbol once per batch"""
+        queue = self._tick_queue
+        while True:
+            flush_due = self._buffer_tick(await queue.get())
+            while not flush_due and not queue.empty():
+                flush_due = self._buffer_tick(queue.get_nowait())
+            
+            symbols = self._tick_dispatcher.drain()
+            if not symbols or not self.analyst or self._state != SystemState.RUNNING:
+                continue
+            
+            try:
+                await self._gather_bounded(
+                    self._analyze(symbol) for symbol in symbols
+                )
+            except Exception as e:
+                logger.error(f"Tick analysis failed: {e}")
+    
+    async def _on_analysis_report(self, event: Event):
+        """Analyst -> Strategist"""
+        if self.strategist and self._state == SystemState.RUNNING:
+            report = event.payload
+            if hasattr(report, "symbol"):
+                await self.strategist.generate_signal(
+                    {"symbol": report.symbol, "technical": {}, "fundamental": {}, "sentiment": {}}
+                )
+    
+    async def _on_trade_signal(self, event: Event):
+        """Strategist -> Portfolio Manager"""
+        if self.portfolio_manager and self._state == SystemState.RUNNING:
+            signal = event.payload
+            proposals = await self.portfolio_manager.generate_order_proposals([signal])
+            for proposal in proposals[:3]:
+                if self.cio:
+                    decision = await self.cio.review_order(proposal)
+                    if decision.status is ApprovalStatus.APPROVED:
+                        await self.portfolio_manager.execute_order(proposal)
     
     async def start(self):
         """Start the trading system"""
@@ -212,6 +303,7 @@ class MainCoordinator:
                 await self.cio.start()
             
             self._state = SystemState.RUNNING
+            self._tick_task = asyncio.create_task(self._consume_ticks())
             
             # Start daily cycle if configured
             if self.config.get("auto_start_cycle", True):
@@ -220,9 +312,8 @@ class MainCoordinator:
             logger.info("AI Trading System started successfully")
             
         except Exception as e:
-            logger.error(f"Failed to start system: {e}", exc_info=True)
             self._state = SystemState.ERROR
-            self._errors.append(str(e))
+            await self._record_error("Failed to start system", e)
             await self.stop()
             raise
     
@@ -232,13 +323,14 @@ class MainCoordinator:
         self._state = SystemState.STOPPING
         self._running = False
         
-        # Stop cycle task
-        if self._cycle_task:
-            self._cycle_task.cancel()
-            try:
-                await self._cycle_task
-            except asyncio.CancelledError:
-                pass
+        # Stop cycle and tick consumer tasks
+        for task in (self._cycle_task, self._tick_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         # Stop all agents
         if self.cio:
@@ -264,21 +356,17 @@ class MainCoordinator:
         while self._running and self._state == SystemState.RUNNING:
             try:
                 now = datetime.now()
-                
-                # Run cycle at market open (9:00) or custom time
-                cycle_time = self.config.get("cycle_time", "09:00")
-                hour, minute = map(int, cycle_time.split(":"))
-                
-                next_cycle = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                if now.hour >= hour:
-                    next_cycle = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    from datetime import timedelta
+                next_cycle = now.replace(
+                    hour=self._cycle_hour, minute=self._cycle_minute, second=0, microsecond=0
+                )
+                if next_cycle <= now:
                     next_cycle += timedelta(days=1)
                 
-                wait_seconds = (next_cycle - now).total_seconds()
-                
-                logger.info(f"Next daily cycle in {wait_seconds/3600:.1f} hours")
-                await asyncio.sleep(wait_seconds)
+                # Sleep against the wall-clock target so early wakeups don't drift
+                sched_ts = next_cycle.timestamp()
+                logger.info(f"Next daily cycle in {(sched_ts - time.time())/3600:.1f} hours")
+                while (delay := sched_ts - time.time()) > 0:
+                    await asyncio.sleep(delay)
                 
                 if self._running:
                     await self.run_daily_cycle()
@@ -286,10 +374,16 @@ class MainCoordinator:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Daily cycle loop error: {e}", exc_info=True)
-                self._errors.append(str(e))
+                await self._record_error("Daily cycle loop error", e)
                 await asyncio.sleep(60)
     
+    async def _record_error(self, message: str, e: Exception, prefix: str = ""):
+        """Record an error and format its traceback off the event loop"""
+        self._errors.append(f"{prefix}{type(e).__name__}: {e}")
+        await asyncio.to_thread(
+            logger.error, f"{message}: {e}", exc_info=(type(e), e, e.__traceback__)
+        )
+    
     async def run_daily_cycle(self):
         """Execute a complete daily trading cycle"""
         cycle_result = CycleResult(
@@ -306,24 +400,22 @@ class MainCoordinator:
             
             # Step 2: Collect data
             if self.collector:
-                for symbol in self.universe:
-                    await self.collector.trigger_collection(
-                        source="kis",
-                        symbols=[symbol],
-                        data_type="daily",
-                    )
+                await self.collector.trigger_collection(
+                    source="kis",
+                    symbols=list(self.universe),
+                    data_type="daily",
+                )
                 cycle_result.metadata["collection_complete"] = True
             
             # Step 3: Analyze all symbols
             signals_generated = 0
             if self.analyst and self.strategist:
-                for symbol in self.universe:
-                    report = await self.analyst.analyze_symbol(symbol)
-                    signal = await self.strategist.generate_signal(
-                        {"symbol": symbol, "technical": {}, "fundamental": {}, "sentiment": {}}
-                    )
-                    if signal and signal.direction != "HOLD":
-                        signals_generated += 1
+                signals = await self._gather_bounded(
+                    self._analyze_and_signal(symbol) for symbol in self.universe
+                )
+                signals_generated = sum(
+                    1 for signal in signals if signal and signal.direction != "HOLD"
+                )
             
             cycle_result.signals_generated = signals_generated
             
@@ -335,15 +427,9 @@ class MainCoordinator:
                 )
                 
                 # Step 5: Review and execute orders
-                trades_executed = 0
-                for proposal in proposals[:self.config.get("max_daily_trades", 10)]:
-                    if self.cio:
-                        decision = await self.cio.review_order(proposal)
-                        if decision.status.value == "APPROVED":
-                            await self.portfolio_manager.execute_order(proposal)
-                            trades_executed += 1
-                
-                cycle_result.trades_executed = trades_executed
+                cycle_result.trades_executed = await self._review_and_execute(
+                    proposals[:self.config.get("max_daily_trades", 10)]
+                )
             
             # Step 6: End daily cycle
             if self.cio:
@@ -352,11 +438,7 @@ class MainCoordinator:
             # Step 7: Rebalance if needed
             if self.portfolio_manager:
                 rebalance_proposals = await self.portfolio_manager.rebalance()
-                for proposal in rebalance_proposals[:5]:
-                    if self.cio:
-                        decision = await self.cio.review_order(proposal)
-                        if decision.status.value == "APPROVED":
-                            await self.portfolio_manager.execute_order(proposal)
+                await self._review_and_execute(rebalance_proposals[:5])
             
             cycle_result.success = True
             cycle_result.completed_at = datetime.now()
@@ -371,14 +453,63 @@ class MainCoordinator:
             )
             
         except Exception as e:
-            logger.error(f"Daily cycle failed: {e}", exc_info=True)
             cycle_result.success = False
             cycle_result.error_message = str(e)
             cycle_result.completed_at = datetime.now()
-            self._errors.append(f"Cycle error: {e}")
+            await self._record_error("Daily cycle failed", e, prefix="Cycle error: ")
         
         self._last_cycle_result = cycle_result
     
+    async def _analyze(self, symbol: str, force: bool = False):
+        """Analyze a symbol, reusing a report younger than report_ttl_seconds"""
+        now = time.monotonic()
+        if not force:
+            cached = self._report_cache.get(symbol)
+            if cached and now - cached[0] < self._report_ttl:
+                return cached[1]
+        
+        report = await self.analyst.analyze_symbol(symbol)
+        # A failed analysis returns None; leave it uncached so the next call retries
+        if report is not None:
+            self._report_cache[symbol] = (now, report)
+        return report
+    
+    async def _analyze_and_signal(self, symbol: str):
+        """Refresh a symbol's analysis, then generate its signal without waiting on other symbols"""
+        await self._analyze(symbol, force=True)
+        return await self.strategist.generate_signal(
+            {"symbol": symbol, "technical": {}, "fundamental": {}, "sentiment": {}}
+        )
+    
+    async def _gather_bounded(self, coros) -> list[Any]:
+        """Run coroutines concurrently, at most _max_concurrency at a time"""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        
+        async def run(coro):
+            async with semaphore:
+                return await coro
+        
+        return await asyncio.gather(*(run(c) for c in coros))
+    
+    async def _review_and_execute(self, proposals: list) -> int:
+        """Review proposals concurrently, execute the approved ones in rank order"""
+        if not self.cio or not proposals:
+            return 0
+        
+        # Safe to run concurrently: review_order checks the daily-trade cap and
+        # records the approval without suspending in between
+        decisions = await self._gather_bounded(
+            self.cio.review_order(proposal) for proposal in proposals
+        )
+        approved = [
+            proposal
+            for proposal, decision in zip(proposals, decisions, strict=True)
+            if decision.status is ApprovalStatus.APPROVED
+        ]
+        for proposal in approved:
+            await self.portfolio_manager.execute_order(proposal)
+        return len(approved)
+    
     async def trigger_signal_generation(self, symbol: str):
         """Manually trigger signal generation for a symbol"""
         if self._state != SystemState.RUNNING:
@@ -388,7 +519,7 @@ class MainCoordinator:
         try:
             # Analyze
             if self.analyst:
-                report = await self.analyst.analyze_symbol(symbol)
+                report = await self._analyze(symbol)
             
             # Generate signal
             if self.strategist:
@@ -400,8 +531,7 @@ class MainCoordinator:
             return None
             
         except Exception as e:
-            logger.error(f"Signal generation failed: {e}")
-            self._errors.append(str(e))
+            await self._record_error("Signal generation failed", e)
             return None
     
     async def trigger_emergency(self, level: EmergencyLevel, reason: str):
@@ -427,26 +557,22 @@ class MainCoordinator:
                 "portfolio_manager": self.portfolio_manager is not None,
                 "cio": self.cio is not None,
             },
-            errors=self._errors[-10:],
+            errors=list(self._errors),
         )
     
     def get_portfolio_status(self) -> dict[str, Any]:
         """Get portfolio status"""
         if self.portfolio_manager:
             portfolio = self.portfolio_manager.get_portfolio()
+            arrays = self.portfolio_manager.get_positions_arrays()
             return {
                 "total_value": portfolio.total_value,
                 "cash": portfolio.cash,
                 "positions": len(portfolio.positions),
-                "positions_detail": [
-                    {
-                        "symbol": p.symbol,
-                        "quantity": p.quantity,
-                        "market_value": p.market_value,
-                        "weight": p.weight,
-                    }
-                    for p in portfolio.positions.values()
-                ],
+                "symbols": arrays["symbol"].tolist(),
+                "quantities": arrays["quantity"].tolist(),
+                "market_values": arrays["market_value"].tolist(),
+                "weights": arrays["weight"].tolist(),
             }
         return {}
     
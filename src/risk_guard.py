@@ -15,17 +15,28 @@ Responsibilities:
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import InitVar, dataclass, field
+from datetime import datetime
 from enum import Enum
+from functools import partial
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
+from _checks_numeric import screen_orders, to_bp
 from core.event_bus import Event, EventBus
 from core.events import EventTypes
 
 
 logger = logging.getLogger("risk_guard")
 
+_PRE_TRADE = "pre_trade_validation"
+
 
 class RiskCheckResult(str, Enum):
     PASSED = "PASSED"
@@ -34,23 +45,41 @@ class RiskCheckResult(str, Enum):
     BLOCKED = "BLOCKED"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskLimit:
     name: str
     value: float
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskCheckReport:
     check_name: str
     result: RiskCheckResult
     message: str
     details: dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Only stamped for non-PASSED results; passing orders skip the clock read
+    timestamp: datetime | None = None
+    now_fn: InitVar[Callable[[], datetime]] = datetime.now
+
+    def __post_init__(self, now_fn: Callable[[], datetime]):
+        if self.timestamp is None and self.result is not RiskCheckResult.PASSED:
+            self.timestamp = now_fn()
 
 
-@dataclass
+@dataclass(slots=True)
+class OrderContext:
+    """Per-order inputs passed to each pre-trade check"""
+    symbol: str
+    direction: str
+    portfolio_total: float
+    inv_portfolio: float  # 1 / portfolio_total, or 0 for an empty portfolio
+    current_positions: dict[str, Any] | None
+    order_value: float
+    order_pct: float
+
+
+@dataclass(slots=True)
 class DailyLossRecord:
     date: datetime
     realized_pnl: float = 0.0
@@ -81,6 +110,9 @@ class RiskGuard:
         self._max_daily_loss_pct = self.config.get("max_daily_loss_pct", 0.02)
         self._max_daily_trades = self.config.get("max_daily_trades", 20)
         self._min_cash_reserve_pct = self.config.get("min_cash_reserve_pct", 0.10)
+        # Ratio limits as integer basis points for the batch screen
+        self._max_position_bp = to_bp(self._max_position_pct)
+        self._max_single_order_bp = to_bp(self._max_single_order_pct)
         
         # Circuit breaker
         self._circuit_breaker_enabled = self.config.get("circuit_breaker_enabled", True)
@@ -88,10 +120,54 @@ class RiskGuard:
         self._circuit_breaker_cooldown_minutes = self.config.get("circuit_breaker_cooldown_minutes", 60)
         
         # State
-        self._daily_loss_record = DailyLossRecord(date=datetime.now())
+        # Read-only status snapshot, dropped whenever reported state changes
+        self._status_cache: Mapping[str, Any] | None = None
+        self._status_limits = MappingProxyType({
+            "max_position_pct": self._max_position_pct,
+            "max_single_order_pct": self._max_single_order_pct,
+            "max_daily_loss_pct": self._max_daily_loss_pct,
+            "max_daily_trades": self._max_daily_trades,
+        })
+        
+        # Local day number of the current record, compared against time.time()
+        # so the rollover check doesn't build datetime/date objects per update
+        self._tz_offset_sec = datetime.now().astimezone().utcoffset().total_seconds()
+        self._reset_daily_record()
         self._circuit_breaker_triggered = False
-        self._circuit_breaker_triggered_at: datetime | None = None
+        # Cooldown is measured on the monotonic clock; the ISO string is for reporting
+        self._circuit_breaker_triggered_mono: float | None = None
+        self._circuit_breaker_triggered_at_iso: str | None = None
+        self._circuit_breaker_cooldown_seconds = self._circuit_breaker_cooldown_minutes * 60.0
+        # Loss ratio for the breaker is taken against an approximate portfolio
+        # value; stored as a reciprocal so the update path multiplies
+        self._cb_inv_portfolio_estimate = 1.0 / self.config.get(
+            "circuit_breaker_portfolio_estimate", 1_000_000
+        )
+        # Static part of the trip event, so firing only attaches reason and time
+        self._cb_event_static = {"cooldown_minutes": self._circuit_breaker_cooldown_minutes}
+        self._make_event = partial(Event, source="risk_guard")
         self._blocked_symbols: set[str] = set()
+        # Interned snapshot probed by order checks, rebuilt on block/unblock
+        self._blocked_symbols_frozen: frozenset[str] = frozenset()
+        
+        # Running market value per position, kept current from portfolio updates
+        self._positions_mv_cache: dict[str, float] = {}
+        self._positions_mv_total: float = 0.0
+        # False until a snapshot or explicit update has filled the cache;
+        # orders that rely on the cache are blocked until then
+        self._positions_synced = False
+        self._positions_arrays: tuple[np.ndarray, np.ndarray] | None = None
+        
+        # Reorderable pre-trade checks (circuit breaker and blocked symbol
+        # are pinned ahead of these) and how often each rejected an order
+        self._check_fns = [
+            self._check_order_size,
+            self._check_position_limit,
+            self._check_daily_trades,
+            self._check_cash_reserve,
+            self._check_daily_loss,
+        ]
+        self._check_rejections: Counter[str] = Counter()
         
         # Event subscriptions
         self._event_subscriptions = []
@@ -101,8 +177,9 @@ class RiskGuard:
         logger.info("Risk Guard initialized")
         
         # Subscribe to events
-        await self.event_bus.subscribe(EventTypes.ORDER_APPROVED, self._on_order_approved)
-        await self.event_bus.subscribe(EventTypes.DAILY_CYCLE_COMPLETE, self._on_daily_cycle_complete)
+        self.event_bus.subscribe(EventTypes.ORDER_APPROVED, self._on_order_approved)
+        self.event_bus.subscribe(EventTypes.DAILY_CYCLE_COMPLETE, self._on_daily_cycle_complete)
+        self.event_bus.subscribe(EventTypes.PORTFOLIO_UPDATED, self._on_portfolio_updated)
     
     # =========================================================================
     # Pre-Trade Risk Checks
@@ -115,107 +192,252 @@ class RiskGuard:
         quantity: int,
         price: float,
         portfolio_total: float,
-        current_positions: dict[str, Any],
+        current_positions: dict[str, Any] | None = None,
     ) -> RiskCheckReport:
-        """Validate an order before execution"""
+        """Validate an order before execution
+        
+        When current_positions is omitted, position values come from the
+        cache fed by PORTFOLIO_UPDATED snapshots (or update_position_value);
+        orders are blocked until that cache has been filled.
+        """
         
-        check_name = "pre_trade_validation"
+        inv_portfolio = 1.0 / portfolio_total if portfolio_total > 0 else 0.0
         order_value = quantity * price
+        ctx = OrderContext(
+            symbol=symbol,
+            direction=direction,
+            portfolio_total=portfolio_total,
+            inv_portfolio=inv_portfolio,
+            current_positions=current_positions,
+            order_value=order_value,
+            order_pct=order_value * inv_portfolio,
+        )
+        return self._run_checks(ctx)
+    
+    async def validate_orders(
+        self,
+        symbols: Sequence[str],
+        directions: Sequence[str],
+        quantities: Sequence[int] | np.ndarray,
+        prices: Sequence[float] | np.ndarray,
+        portfolio_total: float,
+        current_positions: dict[str, Any] | None = None,
+    ) -> list[RiskCheckReport]:
+        """Validate a batch of orders, equivalent to validate_order on each
+        
+        The numeric limits are screened as array operations across the batch;
+        only orders flagged by the screen go through the per-check path.
+        """
+        
+        n = len(symbols)
+        inv_portfolio = 1.0 / portfolio_total if portfolio_total > 0 else 0.0
+        order_values = np.asarray(quantities, dtype=np.float64) * np.asarray(prices, dtype=np.float64)
+        order_pcts = order_values * inv_portfolio
+        is_buy = np.fromiter((d == "BUY" for d in directions), dtype=bool, count=n)
+        
+        if current_positions is None:
+            cache = self._positions_mv_cache
+            current_values = np.fromiter(
+                (cache.get(s, 0.0) for s in symbols), dtype=np.float64, count=n
+            )
+            invested = self._positions_mv_total
+        else:
+            current_values = np.fromiter(
+                (current_positions.get(s, {}).get("market_value", 0) for s in symbols),
+                dtype=np.float64,
+                count=n,
+            )
+            invested = sum(p.get("market_value", 0) for p in current_positions.values())
+        
+        blocked = self._blocked_symbols_frozen
+        record = self._daily_loss_record
+        total_loss = record.realized_pnl + record.unrealized_pnl
+        
+        if (
+            self._circuit_breaker_triggered
+            or (current_positions is None and not self._positions_synced)
+            or record.trades_count >= self._max_daily_trades
+            or (total_loss < 0 and -total_loss * inv_portfolio > self._max_daily_loss_pct)
+        ):
+            flagged = np.ones(n, dtype=bool)
+        else:
+            flagged = np.fromiter(
+                (sys.intern(s) in blocked for s in symbols), dtype=bool, count=n
+            ) | (screen_orders(
+                order_values,
+                current_values,
+                is_buy,
+                inv_portfolio,
+                float(portfolio_total - invested),
+                portfolio_total * self._min_cash_reserve_pct,
+                self._max_single_order_bp,
+                self._max_position_bp,
+            ) != 0)
+        
+        reports = []
+        for i, (symbol, direction) in enumerate(zip(symbols, directions, strict=True)):
+            ctx = OrderContext(
+                symbol=symbol,
+                direction=direction,
+                portfolio_total=portfolio_total,
+                inv_portfolio=inv_portfolio,
+                current_positions=current_positions,
+                order_value=float(order_values[i]),
+                order_pct=float(order_pcts[i]),
+            )
+            reports.append(self._run_checks(ctx) if flagged[i] else self._passed_report(ctx))
+        
+        return reports
+    
+    def _run_checks(self, ctx: OrderContext) -> RiskCheckReport:
+        # Cheap blockers always run first
+        report = (
+            self._check_circuit_breaker(ctx)
+            or self._check_blocked_symbol(ctx)
+            or self._check_positions_known(ctx)
+        )
+        if report:
+            return report
         
-        # Check 1: Circuit breaker
+        # Remaining checks run in order of observed rejections
+        for check in self._check_fns:
+            report = check(ctx)
+            if report:
+                self._check_rejections[check.__name__] += 1
+                return report
+        
+        return self._passed_report(ctx)
+    
+    def _passed_report(self, ctx: OrderContext) -> RiskCheckReport:
+        return RiskCheckReport(
+            check_name=_PRE_TRADE,
+            result=RiskCheckResult.PASSED,
+            message="All risk checks passed",
+            details={
+                "order_value": ctx.order_value,
+                "order_pct": ctx.order_pct,
+                "trades_today": self._daily_loss_record.trades_count,
+            },
+        )
+    
+    def _reorder_checks(self):
+        """Sort checks by rejection count, most frequent first (ties keep declared order)"""
+        rejections = self._check_rejections
+        self._check_fns.sort(key=lambda check: -rejections[check.__name__])
+    
+    def _check_circuit_breaker(self, ctx: OrderContext) -> RiskCheckReport | None:
         if self._circuit_breaker_triggered:
             return RiskCheckReport(
-                check_name=check_name,
+                check_name=_PRE_TRADE,
                 result=RiskCheckResult.BLOCKED,
                 message="Circuit breaker triggered - trading disabled",
-                details={"circuit_breaker_triggered_at": self._circuit_breaker_triggered_at},
+                details={"circuit_breaker_triggered_at": self._circuit_breaker_triggered_at_iso},
             )
-        
-        # Check 2: Blocked symbol
-        if symbol in self._blocked_symbols:
+        return None
+    
+    def _check_positions_known(self, ctx: OrderContext) -> RiskCheckReport | None:
+        if ctx.current_positions is None and not self._positions_synced:
+            return RiskCheckReport(
+                check_name=_PRE_TRADE,
+                result=RiskCheckResult.BLOCKED,
+                message="Position values unknown - no portfolio snapshot received",
+            )
+        return None
+    
+    def _check_blocked_symbol(self, ctx: OrderContext) -> RiskCheckReport | None:
+        if sys.intern(ctx.symbol) in self._blocked_symbols_frozen:
             return RiskCheckReport(
-                check_name=check_name,
+                check_name=_PRE_TRADE,
                 result=RiskCheckResult.BLOCKED,
-                message=f"Symbol {symbol} is blocked",
+                message=f"Symbol {ctx.symbol} is blocked",
                 details={"blocked_symbols": list(self._blocked_symbols)},
             )
-        
-        # Check 3: Order value vs portfolio
-        order_pct = order_value / portfolio_total if portfolio_total > 0 else 0
-        if order_pct > self._max_single_order_pct:
+        return None
+    
+    def _check_order_size(self, ctx: OrderContext) -> RiskCheckReport | None:
+        """Order value vs portfolio"""
+        order_pct = ctx.order_pct
+        max_pct = self._max_single_order_pct
+        if order_pct > max_pct:
             return RiskCheckReport(
-                check_name=check_name,
+                check_name=_PRE_TRADE,
                 result=RiskCheckResult.FAILED,
-                message=f"Order value {order_pct:.2%} exceeds max {self._max_single_order_pct:.2%}",
-                details={"order_pct": order_pct, "max_pct": self._max_single_order_pct},
+                message=f"Order value {order_pct:.2%} exceeds max {max_pct:.2%}",
+                details={"order_pct": order_pct, "max_pct": max_pct},
             )
+        return None
+    
+    def _check_position_limit(self, ctx: OrderContext) -> RiskCheckReport | None:
+        if ctx.direction != "BUY":
+            return None
         
-        # Check 4: Position limit
-        if direction == "BUY":
-            current_position = current_positions.get(symbol, {})
-            current_value = current_position.get("market_value", 0)
-            new_value = current_value + order_value
-            new_pct = new_value / portfolio_total if portfolio_total > 0 else 0
-            
-            if new_pct > self._max_position_pct:
-                return RiskCheckReport(
-                    check_name=check_name,
-                    result=RiskCheckResult.FAILED,
-                    message=f"Position would be {new_pct:.2%}, exceeds max {self._max_position_pct:.2%}",
-                    details={"new_position_pct": new_pct, "max_pct": self._max_position_pct},
-                )
+        if ctx.current_positions is None:
+            current_value = self._positions_mv_cache.get(ctx.symbol, 0.0)
+        else:
+            current_value = ctx.current_positions.get(ctx.symbol, {}).get("market_value", 0)
+        new_pct = (current_value + ctx.order_value) * ctx.inv_portfolio
         
-        # Check 5: Daily trade limit
-        if self._daily_loss_record.trades_count >= self._max_daily_trades:
+        max_pct = self._max_position_pct
+        if new_pct > max_pct:
             return RiskCheckReport(
-                check_name=check_name,
+                check_name=_PRE_TRADE,
                 result=RiskCheckResult.FAILED,
-                message=f"Daily trade limit reached ({self._daily_loss_record.trades_count})",
-                details={"trades_count": self._daily_loss_record.trades_count},
+                message=f"Position would be {new_pct:.2%}, exceeds max {max_pct:.2%}",
+                details={"new_position_pct": new_pct, "max_pct": max_pct},
             )
-        
-        # Check 6: Cash reserve
-        if direction == "BUY":
-            cash_reserve = portfolio_total * self._min_cash_reserve_pct
-            available_cash = portfolio_total - sum(
-                p.get("market_value", 0) for p in current_positions.values()
+        return None
+    
+    def _check_daily_trades(self, ctx: OrderContext) -> RiskCheckReport | None:
+        trades_count = self._daily_loss_record.trades_count
+        if trades_count >= self._max_daily_trades:
+            return RiskCheckReport(
+                check_name=_PRE_TRADE,
+                result=RiskCheckResult.FAILED,
+                message=f"Daily trade limit reached ({trades_count})",
+                details={"trades_count": trades_count},
             )
-            
-            if available_cash - order_value < cash_reserve:
-                return RiskCheckReport(
-                    check_name=check_name,
-                    result=RiskCheckResult.FAILED,
-                    message="Order would violate cash reserve requirement",
-                    details={
-                        "available_cash": available_cash,
-                        "order_value": order_value,
-                        "required_reserve": cash_reserve,
-                    },
-                )
+        return None
+    
+    def _check_cash_reserve(self, ctx: OrderContext) -> RiskCheckReport | None:
+        if ctx.direction != "BUY":
+            return None
         
-        # Check 7: Daily loss limit
-        total_loss = self._daily_loss_record.realized_pnl + self._daily_loss_record.unrealized_pnl
-        loss_pct = abs(total_loss) / portfolio_total if portfolio_total > 0 else 0
+        cash_reserve = ctx.portfolio_total * self._min_cash_reserve_pct
+        if ctx.current_positions is None:
+            invested = self._positions_mv_total
+        else:
+            invested = sum(p.get("market_value", 0) for p in ctx.current_positions.values())
+        available_cash = ctx.portfolio_total - invested
         
-        if total_loss < 0 and loss_pct > self._max_daily_loss_pct:
+        if available_cash - ctx.order_value < cash_reserve:
             return RiskCheckReport(
-                check_name=check_name,
-                result=RiskCheckResult.BLOCKED,
-                message=f"Daily loss {loss_pct:.2%} exceeds max {self._max_daily_loss_pct:.2%}",
-                details={"loss_pct": loss_pct, "max_loss_pct": self._max_daily_loss_pct},
+                check_name=_PRE_TRADE,
+                result=RiskCheckResult.FAILED,
+                message="Order would violate cash reserve requirement",
+                details={
+                    "available_cash": available_cash,
+                    "order_value": ctx.order_value,
+                    "required_reserve": cash_reserve,
+                },
             )
+        return None
+    
+    def _check_daily_loss(self, ctx: OrderContext) -> RiskCheckReport | None:
+        record = self._daily_loss_record
+        total_loss = record.realized_pnl + record.unrealized_pnl
+        if total_loss >= 0:
+            return None
         
-        # All checks passed
-        return RiskCheckReport(
-            check_name=check_name,
-            result=RiskCheckResult.PASSED,
-            message="All risk checks passed",
-            details={
-                "order_value": order_value,
-                "order_pct": order_pct,
-                "trades_today": self._daily_loss_record.trades_count,
-            },
-        )
+        loss_pct = -total_loss * ctx.inv_portfolio
+        max_loss_pct = self._max_daily_loss_pct
+        if loss_pct > max_loss_pct:
+            return RiskCheckReport(
+                check_name=_PRE_TRADE,
+                result=RiskCheckResult.BLOCKED,
+                message=f"Daily loss {loss_pct:.2%} exceeds max {max_loss_pct:.2%}",
+                details={"loss_pct": loss_pct, "max_loss_pct": max_loss_pct},
+            )
+        return None
     
     # =========================================================================
     # Position Risk Checks
@@ -223,26 +445,78 @@ class RiskGuard:
     
     async def check_position_limits(
         self,
-        positions: dict[str, Any],
+        positions: dict[str, Any] | None,
         portfolio_total: float,
     ) -> list[RiskCheckReport]:
-        """Check all positions against limits"""
+        """Check all positions against limits (None checks the cached positions)"""
         
-        reports = []
+        return list(self.check_position_limits_iter(positions, portfolio_total))
+    
+    def check_position_limits_iter(
+        self,
+        positions: dict[str, Any] | None,
+        portfolio_total: float,
+    ) -> Iterator[RiskCheckReport]:
+        """Yield a report per position over the limit, building each lazily
         
-        for symbol, position in positions.items():
-            market_value = position.get("market_value", 0)
-            weight = market_value / portfolio_total if portfolio_total > 0 else 0
-            
-            if weight > self._max_position_pct:
-                reports.append(RiskCheckReport(
-                    check_name="position_limit",
-                    result=RiskCheckResult.WARNING,
-                    message=f"Position {symbol} at {weight:.2%} exceeds limit",
-                    details={"symbol": symbol, "weight": weight},
-                ))
+        Callers that only need to know whether any position is over the
+        limit can stop at the first report.
+        """
         
-        return reports
+        if positions is None:
+            symbols, market_values = self._get_positions_arrays()
+        else:
+            symbols = list(positions)
+            market_values = np.fromiter(
+                (p.get("market_value", 0) for p in positions.values()),
+                dtype=np.float64,
+                count=len(positions),
+            )
+        
+        if portfolio_total <= 0 or not len(market_values):
+            return
+        
+        weights = market_values / portfolio_total
+        
+        for i in np.flatnonzero(weights > self._max_position_pct):
+            yield RiskCheckReport(
+                check_name="position_limit",
+                result=RiskCheckResult.WARNING,
+                message=f"Position {symbols[i]} at {weights[i]:.2%} exceeds limit",
+                details={"symbol": symbols[i], "weight": float(weights[i])},
+            )
+    
+    def _get_positions_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Symbols and market values of the cached positions as parallel arrays"""
+        if self._positions_arrays is None:
+            cache = self._positions_mv_cache
+            self._positions_arrays = (
+                np.array(list(cache), dtype=object),
+                np.fromiter(cache.values(), dtype=np.float64, count=len(cache)),
+            )
+        return self._positions_arrays
+    
+    def update_position_value(self, symbol: str, market_value: float):
+        """Update the cached market value of a position (0 removes it)"""
+        previous = self._positions_mv_cache.get(symbol, 0.0)
+        self._positions_mv_total += market_value - previous
+        self._positions_arrays = None
+        self._positions_synced = True
+        if market_value:
+            self._positions_mv_cache[symbol] = market_value
+        else:
+            self._positions_mv_cache.pop(symbol, None)
+    
+    def replace_positions(self, positions: Mapping[str, Mapping[str, Any]]):
+        """Replace the cached market values with a full portfolio snapshot"""
+        self._positions_mv_cache = {
+            symbol: p.get("market_value", 0)
+            for symbol, p in positions.items()
+            if p.get("market_value", 0)
+        }
+        self._positions_mv_total = float(sum(self._positions_mv_cache.values()))
+        self._positions_arrays = None
+        self._positions_synced = True
     
     # =========================================================================
     # Loss Monitoring
@@ -256,51 +530,63 @@ class RiskGuard:
         """Update daily PnL and circuit breaker"""
         
         # Reset if new day
-        if self._daily_loss_record.date.date() != datetime.now().date():
-            self._daily_loss_record = DailyLossRecord(date=datetime.now())
+        if self._current_day() != self._day_number:
+            self._reset_daily_record()
         
         self._daily_loss_record.realized_pnl += realized_pnl
         self._daily_loss_record.unrealized_pnl = unrealized_pnl
         self._daily_loss_record.trades_count += 1
+        self._status_cache = None
         
         # Check circuit breaker
         if self._circuit_breaker_enabled:
             total_pnl = self._daily_loss_record.realized_pnl + unrealized_pnl
-            loss_pct = abs(total_pnl) / 1000000  # Approximate portfolio value
+            loss_pct = abs(total_pnl) * self._cb_inv_portfolio_estimate
             
             if total_pnl < 0 and loss_pct >= self._circuit_breaker_loss_pct:
                 await self._trigger_circuit_breaker(
                     f"Daily loss {loss_pct:.2%} exceeds threshold"
                 )
     
+    def _current_day(self) -> int:
+        return int((time.time() + self._tz_offset_sec) // 86400)
+    
+    def _reset_daily_record(self):
+        self._daily_loss_record = DailyLossRecord(date=datetime.now())
+        self._day_number = self._current_day()
+        self._status_cache = None
+    
     async def _trigger_circuit_breaker(self, reason: str):
         """Trigger circuit breaker"""
         
         self._circuit_breaker_triggered = True
-        self._circuit_breaker_triggered_at = datetime.now()
+        self._circuit_breaker_triggered_mono = time.monotonic()
+        self._circuit_breaker_triggered_at_iso = datetime.now().isoformat()
+        self._status_cache = None
         
-        logger.warning(f"CIRCUIT BREAKER TRIGGERED: {reason}")
+        logger.warning("CIRCUIT BREAKER TRIGGERED: %s", reason)
         
         # Publish event
-        await self.event_bus.publish(Event(
+        await self.event_bus.publish(self._make_event(
             type=EventTypes.CIRCUIT_BREAKER_TRIGGERED,
             payload={
+                **self._cb_event_static,
                 "reason": reason,
-                "triggered_at": self._circuit_breaker_triggered_at.isoformat(),
-                "cooldown_minutes": self._circuit_breaker_cooldown_minutes,
+                "triggered_at": self._circuit_breaker_triggered_at_iso,
             },
-            source="risk_guard",
         ))
     
     async def reset_circuit_breaker(self):
         """Reset circuit breaker after cooldown"""
         
         if self._circuit_breaker_triggered:
-            if self._circuit_breaker_triggered_at:
-                elapsed = datetime.now() - self._circuit_breaker_triggered_at
-                if elapsed >= timedelta(minutes=self._circuit_breaker_cooldown_minutes):
+            if self._circuit_breaker_triggered_mono is not None:
+                elapsed = time.monotonic() - self._circuit_breaker_triggered_mono
+                if elapsed >= self._circuit_breaker_cooldown_seconds:
                     self._circuit_breaker_triggered = False
-                    self._circuit_breaker_triggered_at = None
+                    self._circuit_breaker_triggered_mono = None
+                    self._circuit_breaker_triggered_at_iso = None
+                    self._status_cache = None
                     logger.info("Circuit breaker reset")
     
     # =========================================================================
@@ -309,17 +595,21 @@ class RiskGuard:
     
     def block_symbol(self, symbol: str, reason: str = ""):
         """Block a symbol from trading"""
-        self._blocked_symbols.add(symbol)
-        logger.warning(f"Symbol {symbol} blocked: {reason}")
+        self._blocked_symbols.add(sys.intern(symbol))
+        self._blocked_symbols_frozen = frozenset(self._blocked_symbols)
+        self._status_cache = None
+        logger.warning("Symbol %s blocked: %s", symbol, reason)
     
     def unblock_symbol(self, symbol: str):
         """Unblock a symbol"""
         self._blocked_symbols.discard(symbol)
-        logger.info(f"Symbol {symbol} unblocked")
+        self._blocked_symbols_frozen = frozenset(self._blocked_symbols)
+        self._status_cache = None
+        logger.info("Symbol %s unblocked", symbol)
     
     def is_symbol_blocked(self, symbol: str) -> bool:
         """Check if symbol is blocked"""
-        return symbol in self._blocked_symbols
+        return symbol in self._blocked_symbols_frozen
     
     # =========================================================================
     # Event Handlers
@@ -327,34 +617,38 @@ class RiskGuard:
     
     async def _on_order_approved(self, event: Event):
         """Handle order approved event"""
-        logger.debug(f"Order approved: {event.payload}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Order approved: %r", event.payload)
+    
+    async def _on_portfolio_updated(self, event: Event):
+        """Replace cached position values with the published snapshot"""
+        payload = event.payload
+        positions = payload.get("positions") if isinstance(payload, dict) else None
+        if positions is not None:
+            self.replace_positions(positions)
     
     async def _on_daily_cycle_complete(self, event: Event):
         """Handle daily cycle complete"""
         # Reset daily counters
-        self._daily_loss_record = DailyLossRecord(date=datetime.now())
+        self._reset_daily_record()
         logger.info("Daily loss record reset")
+        
+        self._reorder_checks()
     
     # =========================================================================
     # Status
     # =========================================================================
     
-    def get_status(self) -> dict[str, Any]:
-        """Get Risk Guard status"""
-        return {
-            "circuit_breaker_triggered": self._circuit_breaker_triggered,
-            "circuit_breaker_triggered_at": (
-                self._circuit_breaker_triggered_at.isoformat()
-                if self._circuit_breaker_triggered_at else None
-            ),
-            "blocked_symbols": list(self._blocked_symbols),
-            "daily_trades": self._daily_loss_record.trades_count,
-            "daily_realized_pnl": self._daily_loss_record.realized_pnl,
-            "daily_unrealized_pnl": self._daily_loss_record.unrealized_pnl,
-            "limits": {
-                "max_position_pct": self._max_position_pct,
-                "max_single_order_pct": self._max_single_order_pct,
-                "max_daily_loss_pct": self._max_daily_loss_pct,
-                "max_daily_trades": self._max_daily_trades,
-            },
-        }
+    def get_status(self) -> Mapping[str, Any]:
+        """Get Risk Guard status (read-only, rebuilt only after state changes)"""
+        if self._status_cache is None:
+            self._status_cache = MappingProxyType({
+                "circuit_breaker_triggered": self._circuit_breaker_triggered,
+                "circuit_breaker_triggered_at": self._circuit_breaker_triggered_at_iso,
+                "blocked_symbols": tuple(self._blocked_symbols),
+                "daily_trades": self._daily_loss_record.trades_count,
+                "daily_realized_pnl": self._daily_loss_record.realized_pnl,
+                "daily_unrealized_pnl": self._daily_loss_record.unrealized_pnl,
+                "limits": self._status_limits,
+            })
+        return self._status_cache
@@ -0,0 +1,59 @@
+"""
+Shared test fixtures
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+
+import pytest
+
+
+class _NullBus:
+    """EventBus stand-in for tests that never observe delivered events"""
+
+    def subscribe(self, *args, **kwargs):
+        pass
+
+    async def publish(self, *args, **kwargs):
+        pass
+
+    def publish_nowait(self, *args, **kwargs):
+        pass
+
+    async def publish_and_wait(self, *args, **kwargs):
+        return []
+
+
+@pytest.fixture(scope="session")
+def event_bus_stub():
+    return _NullBus()
+
+
+@pytest.fixture
+def fixed_now():
+    return datetime(2024, 1, 1, 9, 30, 0)
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def _no_leaked_tasks():
+    """All async tests share one session loop; fail if any left tasks behind"""
+    yield
+    current = asyncio.current_task()
+    pending = [t for t in asyncio.all_tasks() if t is not current and not t.done()]
+    assert not pending, f"tasks left running on the session loop: {pending}"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_logs():
+    """Skip INFO/DEBUG formatting from the agents under test"""
+    loggers = [
+        logging.getLogger(name)
+        for name in ("risk_guard", "event_bus", "portfolio_manager", "strategist_agent")
+    ]
+    levels = [lg.level for lg in loggers]
+    for lg in loggers:
+        lg.setLevel(logging.WARNING)
+    yield
+    for lg, level in zip(loggers, levels, strict=True):
+        lg.setLevel(level)
@@ -27,13 +27,11 @@ def analyst_agent(event_bus):
 
 
 class TestAnalystAgent:
-    @pytest.mark.asyncio
     async def test_analyst_agent_creation(self, analyst_agent):
         assert analyst_agent is not None
         assert analyst_agent._running is False
         assert analyst_agent._analysis_cache == {}
 
-    @pytest.mark.asyncio
     async def test_start_and_stop(self, analyst_agent):
         await analyst_agent.start()
         assert analyst_agent._running is True
@@ -41,7 +39,6 @@ class TestAnalystAgent:
         await analyst_agent.stop()
         assert analyst_agent._running is False
 
-    @pytest.mark.asyncio
     async def test_get_status(self, analyst_agent):
         status = analyst_agent.get_status()
         
@@ -50,7 +47,6 @@ class TestAnalystAgent:
         assert "subscribers" in status
         assert status["running"] is False
 
-    @pytest.mark.asyncio
     async def test_subscribe(self, analyst_agent):
         callback = MagicMock()
         analyst_agent.subscribe("price_tick", callback)
@@ -58,7 +54,6 @@ class TestAnalystAgent:
         assert "price_tick" in analyst_agent._subscribers
         assert callback in analyst_agent._subscribers["price_tick"]
 
-    @pytest.mark.asyncio
     async def test_get_report_not_found(self, analyst_agent):
         report = analyst_agent.get_report("005930")
         assert report is None
@@ -158,12 +153,10 @@ class TestSentimentScore:
 
 
 class TestAnalysisReport:
-    def test_analysis_report_creation(self):
-        from datetime import datetime
-        
+    def test_analysis_report_creation(self, fixed_now):
         report = AnalysisReport(
             symbol="005930",
-            timestamp=datetime.now(),
+            timestamp=fixed_now,
             technical=TechnicalSignals(rsi=45.0),
             fundamental=FundamentalScore(per=10.0),
             sentiment=SentimentScore(sentiment_ratio=0.5),
@@ -176,12 +169,10 @@ class TestAnalysisReport:
         assert report.overall_signal == "BUY"
         assert report.confidence == 0.8
 
-    def test_analysis_report_defaults(self):
-        from datetime import datetime
-        
+    def test_analysis_report_defaults(self, fixed_now):
         report = AnalysisReport(
             symbol="005930",
-            timestamp=datetime.now(),
+            timestamp=fixed_now,
         )
         
         assert report.technical is None
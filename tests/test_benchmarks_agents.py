@@ -0,0 +1,73 @@
+"""
+Benchmarks for the hottest agent paths
+
+Run under CodSpeed with `pytest tests/test_benchmarks_agents.py --codspeed`;
+without --codspeed each benchmarked call runs once as an ordinary test.
+Agents are built in fixtures so only the hot call is measured.
+"""
+
+import pytest
+
+from agents.portfolio.agent import OrderProposal, Portfolio, PortfolioManager
+from agents.strategist.agent import StrategistAgent
+from risk_guard import RiskCheckResult, RiskGuard
+
+_BUY = OrderProposal(symbol="005930", direction="BUY", quantity=100, price=50000)
+_POSITIONS = {"005930": {"market_value": 500000}}
+
+
+def _run(coro):
+    """Drive a coroutine that completes without suspending, outside any event loop"""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("benchmarked coroutine suspended")
+
+
+@pytest.fixture
+def portfolio_manager(event_bus_stub):
+    return PortfolioManager(event_bus=event_bus_stub)
+
+
+@pytest.fixture
+def risk_guard(event_bus_stub):
+    return RiskGuard(event_bus=event_bus_stub)
+
+
+@pytest.fixture
+def strategist_agent(event_bus_stub):
+    return StrategistAgent(event_bus=event_bus_stub)
+
+
+def test_execute_order(benchmark, portfolio_manager):
+    def fresh_portfolio():
+        portfolio_manager._portfolio = Portfolio(cash=10000000)
+    
+    benchmark.pedantic(
+        lambda: _run(portfolio_manager.execute_order(_BUY)),
+        setup=fresh_portfolio,
+        rounds=100,
+    )
+    
+    assert portfolio_manager._portfolio.positions["005930"].quantity == 100
+
+
+def test_validate_order(benchmark, risk_guard):
+    result = benchmark(lambda: _run(risk_guard.validate_order(
+        symbol="005930",
+        direction="SELL",
+        quantity=10,
+        price=50000,
+        portfolio_total=10000000,
+        current_positions=_POSITIONS,
+    )))
+    
+    assert result.result == RiskCheckResult.PASSED
+
+
+def test_set_investment_direction(benchmark, strategist_agent):
+    thesis = benchmark(lambda: _run(strategist_agent.set_investment_direction("BULL")))
+    
+    assert thesis.regime == "BULL"
@@ -0,0 +1,33 @@
+"""
+Tests for CIO Agent
+"""
+
+import asyncio
+
+import pytest
+
+from agents.cio import ApprovalStatus, CIOAgent
+from agents.portfolio.agent import OrderProposal
+
+
+@pytest.fixture
+async def cio_agent(event_bus_stub):
+    agent = CIOAgent(event_bus=event_bus_stub, config={"max_daily_trades": 3})
+    await agent.start_daily_cycle()
+    return agent
+
+
+class TestCIOAgent:
+    async def test_concurrent_reviews_respect_daily_trade_cap(self, cio_agent):
+        # MainCoordinator._review_and_execute gathers review_order calls; the
+        # cap only holds while the check and the append share one step
+        proposals = [
+            OrderProposal(symbol=f"00{i:04d}", direction="BUY", quantity=10, price=10000)
+            for i in range(8)
+        ]
+        
+        decisions = await asyncio.gather(*(cio_agent.review_order(p) for p in proposals))
+        
+        approved = [d for d in decisions if d.status is ApprovalStatus.APPROVED]
+        assert len(approved) == 3
+        assert len(cio_agent._daily_plan.approved_orders) == 3
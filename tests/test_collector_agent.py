@@ -26,14 +26,12 @@ def collector_agent(event_bus):
 
 
 class TestCollectorAgent:
-    @pytest.mark.asyncio
     async def test_collector_agent_creation(self, collector_agent):
         assert collector_agent is not None
         assert collector_agent._running is False
         assert len(collector_agent._collectors) == 0
         assert len(collector_agent._tasks) == 0
 
-    @pytest.mark.asyncio
     async def test_register_collector(self, collector_agent):
         mock_collector = MagicMock()
         mock_collector.source = DataSource.KIS
@@ -43,7 +41,6 @@ class TestCollectorAgent:
         assert DataSource.KIS in collector_agent._collectors
         mock_collector.start.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_register_task(self, collector_agent):
         task = CollectionTask(
             id="test_task",
@@ -57,7 +54,6 @@ class TestCollectorAgent:
         assert "test_task" in collector_agent._tasks
         assert collector_agent._tasks["test_task"].id == "test_task"
 
-    @pytest.mark.asyncio
     async def test_remove_task(self, collector_agent):
         task = CollectionTask(
             id="test_task",
@@ -70,23 +66,23 @@ class TestCollectorAgent:
         
         assert "test_task" not in collector_agent._tasks
 
-    @pytest.mark.asyncio
     async def test_start_and_stop(self, collector_agent):
         mock_collector = MagicMock()
         mock_collector.source = DataSource.KIS
+        mock_collector.start = AsyncMock()
+        mock_collector.stop = AsyncMock()
         collector_agent.register_collector(mock_collector)
         
         await collector_agent.start()
         
         assert collector_agent._running is True
-        mock_collector.start.assert_called_once()
+        mock_collector.start.assert_awaited_once()
         
         await collector_agent.stop()
         
         assert collector_agent._running is False
-        mock_collector.stop.assert_called_once()
+        mock_collector.stop.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_get_status(self, collector_agent):
         mock_collector = MagicMock()
         mock_collector.source = DataSource.KIS
@@ -131,14 +127,12 @@ class TestCollectionTask:
 
 
 class TestCollectedData:
-    def test_collected_data_creation(self):
-        from datetime import datetime
-        
+    def test_collected_data_creation(self, fixed_now):
         data = CollectedData(
             source=DataSource.KIS,
             data_type="tick",
             symbol="005930",
-            timestamp=datetime.now(),
+            timestamp=fixed_now,
             payload={"price": "75000"},
             metadata={"source": "kis"},
         )
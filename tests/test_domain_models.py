@@ -0,0 +1,291 @@
+"""
+Tests for domain models and enums
+
+Construction, default and enum-value checks that need no agent or event bus.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from agents.portfolio.agent import (
+    OrderProposal,
+    Portfolio,
+    Position,
+    RebalanceTrigger,
+)
+from agents.strategist.agent import (
+    InvestmentThesis,
+    StrategyType,
+    TradeSignal,
+)
+from risk_guard import (
+    DailyLossRecord,
+    RiskCheckReport,
+    RiskCheckResult,
+)
+
+pytestmark = pytest.mark.domain_models
+
+
+_FIXED_NOW = datetime(2024, 1, 1, 9, 0, 0)
+
+
+class TestPortfolio:
+    def test_portfolio_creation(self):
+        portfolio = Portfolio(
+            total_value=10000000,
+            cash=5000000,
+        )
+        
+        assert portfolio.total_value == 10000000
+        assert portfolio.cash == 5000000
+        assert portfolio.positions == {}
+        assert portfolio.last_rebalance is None
+
+    def test_portfolio_defaults(self):
+        portfolio = Portfolio()
+        
+        assert portfolio.total_value == 0
+        assert portfolio.cash == 0
+        assert portfolio.positions == {}
+
+
+class TestPosition:
+    def test_position_creation(self):
+        position = Position(
+            symbol="005930",
+            quantity=100,
+            avg_price=75000,
+            current_price=80000,
+            market_value=8000000,
+            unrealized_pnl=500000,
+            weight=0.40,
+        )
+        
+        assert position.symbol == "005930"
+        assert position.quantity == 100
+        assert position.avg_price == 75000
+        assert position.current_price == 80000
+        assert position.market_value == 8000000
+        assert position.unrealized_pnl == 500000
+
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("symbol", "005930"),
+            ("quantity", 0),
+            ("avg_price", 0),
+            ("current_price", 0),
+            ("market_value", 0),
+        ],
+    )
+    def test_position_defaults(self, attr, expected):
+        position = Position(symbol="005930")
+        
+        assert getattr(position, attr) == expected
+
+
+class TestOrderProposal:
+    def test_order_proposal_creation(self):
+        proposal = OrderProposal(
+            symbol="005930",
+            direction="BUY",
+            quantity=100,
+            price=75000,
+            order_type="LIMIT",
+            reason="Momentum signal",
+            priority=8,
+        )
+        
+        assert proposal.symbol == "005930"
+        assert proposal.direction == "BUY"
+        assert proposal.quantity == 100
+        assert proposal.price == 75000
+        assert proposal.order_type == "LIMIT"
+        assert proposal.priority == 8
+
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("price", None),
+            ("order_type", "MARKET"),
+            ("reason", ""),
+            ("priority", 0),
+        ],
+    )
+    def test_order_proposal_defaults(self, attr, expected):
+        proposal = OrderProposal(
+            symbol="005930",
+            direction="SELL",
+            quantity=50,
+        )
+        
+        assert getattr(proposal, attr) == expected
+
+
+class TestRebalanceTrigger:
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (RebalanceTrigger.DAILY, "daily"),
+            (RebalanceTrigger.WEEKLY, "weekly"),
+            (RebalanceTrigger.SIGNAL, "signal"),
+            (RebalanceTrigger.THRESHOLD, "threshold"),
+            (RebalanceTrigger.EMERGENCY, "emergency"),
+        ],
+    )
+    def test_rebalance_trigger_values(self, member, value):
+        assert member.value == value
+
+
+class TestRiskCheckResult:
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (RiskCheckResult.PASSED, "PASSED"),
+            (RiskCheckResult.FAILED, "FAILED"),
+            (RiskCheckResult.WARNING, "WARNING"),
+            (RiskCheckResult.BLOCKED, "BLOCKED"),
+        ],
+    )
+    def test_risk_check_result_values(self, member, value):
+        assert member.value == value
+
+
+class TestRiskCheckReport:
+    def test_risk_check_report_creation(self):
+        report = RiskCheckReport(
+            check_name="test_check",
+            result=RiskCheckResult.PASSED,
+            message="Test passed",
+            details={"value": 100},
+        )
+        
+        assert report.check_name == "test_check"
+        assert report.result == RiskCheckResult.PASSED
+        assert report.message == "Test passed"
+        assert report.details["value"] == 100
+
+    def test_risk_check_report_defaults(self):
+        report = RiskCheckReport(
+            check_name="test",
+            result=RiskCheckResult.FAILED,
+            message="Failed",
+        )
+        
+        assert report.details == {}
+        assert report.timestamp is not None
+
+    def test_risk_check_report_now_fn(self):
+        failed = RiskCheckReport(
+            check_name="test",
+            result=RiskCheckResult.FAILED,
+            message="Failed",
+            now_fn=lambda: _FIXED_NOW,
+        )
+        passed = RiskCheckReport(
+            check_name="test",
+            result=RiskCheckResult.PASSED,
+            message="Passed",
+            now_fn=lambda: _FIXED_NOW,
+        )
+        
+        assert failed.timestamp == _FIXED_NOW
+        assert passed.timestamp is None
+
+
+class TestDailyLossRecord:
+    def test_daily_loss_record_creation(self):
+        record = DailyLossRecord(
+            date=_FIXED_NOW,
+            realized_pnl=-100000,
+            unrealized_pnl=-50000,
+            trades_count=5,
+        )
+        
+        assert record.realized_pnl == -100000
+        assert record.unrealized_pnl == -50000
+        assert record.trades_count == 5
+
+    def test_daily_loss_record_defaults(self):
+        record = DailyLossRecord(date=_FIXED_NOW)
+        
+        assert record.realized_pnl == 0
+        assert record.unrealized_pnl == 0
+        assert record.trades_count == 0
+
+
+class TestStrategyType:
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (StrategyType.MOMENTUM, "momentum"),
+            (StrategyType.VALUE, "value"),
+            (StrategyType.MEAN_REVERSION, "mean_reversion"),
+            (StrategyType.BREAKOUT, "breakout"),
+            (StrategyType.COMPOSITE, "composite"),
+        ],
+    )
+    def test_strategy_type_values(self, member, value):
+        assert member.value == value
+
+
+class TestTradeSignal:
+    def test_trade_signal_creation(self):
+        signal = TradeSignal(
+            symbol="005930",
+            direction="BUY",
+            strength=0.8,
+            target_price=80000,
+            stop_loss_price=72000,
+            take_profit_price=85000,
+            strategy_name="Momentum",
+            reasoning="Strong uptrend with positive RSI",
+            max_position_pct=0.10,
+            urgency="TODAY",
+        )
+        
+        assert signal.symbol == "005930"
+        assert signal.direction == "BUY"
+        assert signal.strength == 0.8
+        assert signal.strategy_name == "Momentum"
+
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("target_price", None),
+            ("stop_loss_price", None),
+            ("strategy_name", ""),
+            ("reasoning", ""),
+            ("max_position_pct", 0.05),
+            ("urgency", "THIS_WEEK"),
+        ],
+    )
+    def test_trade_signal_defaults(self, attr, expected):
+        signal = TradeSignal(
+            symbol="005930",
+            direction="HOLD",
+            strength=0.0,
+        )
+        
+        assert getattr(signal, attr) == expected
+
+
+class TestInvestmentThesis:
+    def test_investment_thesis_creation(self):
+        thesis = InvestmentThesis(
+            regime="BULL",
+            mode="AGGRESSIVE",
+            cash_target_pct=0.10,
+            sector_allocation={
+                "technology": 0.30,
+                "finance": 0.20,
+            },
+            risk_level="HIGH",
+        )
+        
+        assert thesis.regime == "BULL"
+        assert thesis.mode == "AGGRESSIVE"
+        assert thesis.cash_target_pct == 0.10
+        assert thesis.risk_level == "HIGH"
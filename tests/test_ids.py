@@ -0,0 +1,36 @@
+"""
+Tests for identifier generation
+"""
+
+import os
+
+import pytest
+
+from core.ids import pooled_uuid4
+
+
+def test_pooled_uuid4_is_version_4():
+    first, second = pooled_uuid4(), pooled_uuid4()
+    
+    assert first.version == 4
+    assert first != second
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_pooled_uuid4_not_shared_after_fork():
+    pooled_uuid4()  # fill the pool before forking
+    
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, pooled_uuid4().bytes)
+        os._exit(0)
+    
+    os.close(write_fd)
+    child_bytes = os.read(read_fd, 16)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    
+    assert pooled_uuid4().bytes != child_bytes
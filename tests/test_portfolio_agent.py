@@ -2,17 +2,18 @@
 Tests for Portfolio Manager Agent
 """
 
+import dataclasses
+
 import pytest
-from unittest.mock import MagicMock
 
 from agents.portfolio.agent import (
     PortfolioManager,
     Portfolio,
     Position,
     OrderProposal,
-    RebalanceTrigger,
 )
 from core.event_bus import EventBus
+from core.events import EventTypes
 
 
 @pytest.fixture
@@ -20,28 +21,35 @@ def event_bus():
     return EventBus()
 
 
+@pytest.fixture(scope="module")
+def _portfolio_manager(event_bus_stub):
+    return PortfolioManager(event_bus=event_bus_stub)
+
+
 @pytest.fixture
-def portfolio_manager(event_bus):
-    return PortfolioManager(event_bus=event_bus)
+def portfolio_manager(_portfolio_manager):
+    _portfolio_manager._portfolio = Portfolio()
+    _portfolio_manager._positions_arrays = None
+    _portfolio_manager._running = False
+    return _portfolio_manager
 
 
 class TestPortfolioManager:
-    @pytest.mark.asyncio
     async def test_portfolio_manager_creation(self, portfolio_manager):
         assert portfolio_manager is not None
         assert portfolio_manager._running is False
         assert portfolio_manager._portfolio.cash == 0
         assert len(portfolio_manager._portfolio.positions) == 0
 
-    @pytest.mark.asyncio
-    async def test_start_and_stop(self, portfolio_manager):
+    async def test_start_and_stop(self, event_bus):
+        portfolio_manager = PortfolioManager(event_bus=event_bus)
+        
         await portfolio_manager.start()
         assert portfolio_manager._running is True
         
         await portfolio_manager.stop()
         assert portfolio_manager._running is False
 
-    @pytest.mark.asyncio
     async def test_get_portfolio(self, portfolio_manager):
         portfolio = portfolio_manager.get_portfolio()
         
@@ -49,12 +57,10 @@ class TestPortfolioManager:
         assert portfolio.total_value == 0
         assert portfolio.cash == 0
 
-    @pytest.mark.asyncio
     async def test_get_position_not_found(self, portfolio_manager):
         position = portfolio_manager.get_position("005930")
         assert position is None
 
-    @pytest.mark.asyncio
     async def test_get_status(self, portfolio_manager):
         status = portfolio_manager.get_status()
         
@@ -64,164 +70,99 @@ class TestPortfolioManager:
         assert "positions" in status
 
 
-class TestPortfolio:
-    def test_portfolio_creation(self):
-        portfolio = Portfolio(
-            total_value=10000000,
-            cash=5000000,
-        )
-        
-        assert portfolio.total_value == 10000000
-        assert portfolio.cash == 5000000
-        assert portfolio.positions == {}
-        assert portfolio.last_rebalance is None
-
-    def test_portfolio_defaults(self):
-        portfolio = Portfolio()
-        
-        assert portfolio.total_value == 0
-        assert portfolio.cash == 0
-        assert portfolio.positions == {}
+# Position is mutable and execute_order updates it in place; tests install
+# dataclasses.replace copies so the template stays intact
+_POS_SAMSUNG_100 = Position(
+    symbol="005930",
+    quantity=100,
+    avg_price=50000,
+    current_price=50000,
+    market_value=5000000,
+)
 
 
-class TestPosition:
-    def test_position_creation(self):
-        position = Position(
-            symbol="005930",
-            quantity=100,
-            avg_price=75000,
-            current_price=80000,
-            market_value=8000000,
-            unrealized_pnl=500000,
-            weight=0.40,
-        )
+class TestPortfolioOperations:
+    @pytest.mark.parametrize(
+        "cash,position,proposal,expected_cash,expected_quantity",
+        [
+            pytest.param(
+                10000000,
+                None,
+                OrderProposal(symbol="005930", direction="BUY", quantity=100, price=50000),
+                5000000,
+                100,
+                id="buy",
+            ),
+            pytest.param(
+                5000000,
+                dataclasses.replace(_POS_SAMSUNG_100, current_price=55000, market_value=5500000),
+                OrderProposal(symbol="005930", direction="SELL", quantity=50, price=55000),
+                7750000,
+                50,
+                id="sell",
+            ),
+        ],
+    )
+    async def test_execute_order(
+        self, portfolio_manager, cash, position, proposal, expected_cash, expected_quantity
+    ):
+        portfolio_manager._portfolio.cash = cash
+        if position is not None:
+            portfolio_manager._portfolio.positions[position.symbol] = dataclasses.replace(position)
         
-        assert position.symbol == "005930"
-        assert position.quantity == 100
-        assert position.avg_price == 75000
-        assert position.current_price == 80000
-        assert position.market_value == 8000000
-        assert position.unrealized_pnl == 500000
-
-    def test_position_defaults(self):
-        position = Position(symbol="005930")
+        await portfolio_manager.execute_order(proposal)
         
-        assert position.symbol == "005930"
-        assert position.quantity == 0
-        assert position.avg_price == 0
-        assert position.current_price == 0
-        assert position.market_value == 0
-
+        assert portfolio_manager._portfolio.positions["005930"].quantity == expected_quantity
+        assert portfolio_manager._portfolio.cash == expected_cash
 
-class TestOrderProposal:
-    def test_order_proposal_creation(self):
-        proposal = OrderProposal(
-            symbol="005930",
-            direction="BUY",
-            quantity=100,
-            price=75000,
-            order_type="LIMIT",
-            reason="Momentum signal",
-            priority=8,
-        )
+    async def test_execute_order_publishes_snapshot(self, event_bus):
+        snapshots = []
         
-        assert proposal.symbol == "005930"
-        assert proposal.direction == "BUY"
-        assert proposal.quantity == 100
-        assert proposal.price == 75000
-        assert proposal.order_type == "LIMIT"
-        assert proposal.priority == 8
-
-    def test_order_proposal_defaults(self):
-        proposal = OrderProposal(
-            symbol="005930",
-            direction="SELL",
-            quantity=50,
-        )
+        async def on_update(event):
+            snapshots.append(event.payload)
         
-        assert proposal.price is None
-        assert proposal.order_type == "MARKET"
-        assert proposal.reason == ""
-        assert proposal.priority == 0
-
-
-class TestRebalanceTrigger:
-    def test_rebalance_trigger_values(self):
-        assert RebalanceTrigger.DAILY.value == "daily"
-        assert RebalanceTrigger.WEEKLY.value == "weekly"
-        assert RebalanceTrigger.SIGNAL.value == "signal"
-        assert RebalanceTrigger.THRESHOLD.value == "threshold"
-        assert RebalanceTrigger.EMERGENCY.value == "emergency"
-
-
-class TestPortfolioOperations:
-    @pytest.mark.asyncio
-    async def test_execute_buy_order(self, portfolio_manager):
+        event_bus.subscribe(EventTypes.PORTFOLIO_UPDATED, on_update)
+        portfolio_manager = PortfolioManager(event_bus=event_bus)
         portfolio_manager._portfolio.cash = 10000000
         
-        proposal = OrderProposal(
-            symbol="005930",
-            direction="BUY",
-            quantity=100,
-            price=50000,
+        await portfolio_manager.execute_order(
+            OrderProposal(symbol="005930", direction="BUY", quantity=100, price=50000)
         )
         
-        await portfolio_manager.execute_order(proposal)
-        
-        assert "005930" in portfolio_manager._portfolio.positions
-        assert portfolio_manager._portfolio.cash == 5000000
+        assert snapshots[-1]["positions"] == {"005930": {"market_value": 5000000}}
 
-    @pytest.mark.asyncio
-    async def test_execute_sell_order(self, portfolio_manager):
-        portfolio_manager._portfolio.cash = 5000000
-        portfolio_manager._portfolio.positions["005930"] = Position(
-            symbol="005930",
-            quantity=100,
-            avg_price=50000,
-            current_price=55000,
-            market_value=5500000,
-        )
-        
-        proposal = OrderProposal(
-            symbol="005930",
-            direction="SELL",
-            quantity=50,
-            price=55000,
-        )
-        
-        await portfolio_manager.execute_order(proposal)
-        
-        assert portfolio_manager._portfolio.positions["005930"].quantity == 50
-        assert portfolio_manager._portfolio.cash == 7750000
+    async def test_get_positions_arrays(self, portfolio_manager):
+        portfolio_manager._portfolio.cash = 10000000
 
-    @pytest.mark.asyncio
-    async def test_check_risk_limits_pass(self, portfolio_manager):
-        portfolio_manager._portfolio.total_value = 10000000
-        portfolio_manager._portfolio.cash = 5000000
-        
         proposal = OrderProposal(
             symbol="005930",
             direction="BUY",
             quantity=100,
             price=50000,
         )
-        
-        passed, message = portfolio_manager.check_risk_limits(proposal)
-        
-        assert passed is True
-        assert message == "OK"
 
-    @pytest.mark.asyncio
-    async def test_check_risk_limits_cash_reserve(self, portfolio_manager):
+        await portfolio_manager.execute_order(proposal)
+        arrays = portfolio_manager.get_positions_arrays()
+
+        assert arrays["symbol"].tolist() == ["005930"]
+        assert arrays["quantity"].tolist() == [100]
+        assert arrays["market_value"].tolist() == [5000000.0]
+        assert arrays["weight"].tolist() == [0.5]
+
+    @pytest.mark.parametrize(
+        "cash,position,expected",
+        [
+            pytest.param(5000000, None, (True, "OK"), id="pass"),
+            pytest.param(
+                500000, _POS_SAMSUNG_100, (False, "Cash reserve below minimum"), id="cash_reserve"
+            ),
+        ],
+    )
+    async def test_check_risk_limits(self, portfolio_manager, cash, position, expected):
         portfolio_manager._portfolio.total_value = 10000000
-        portfolio_manager._portfolio.cash = 500000
-        portfolio_manager._portfolio.positions["005930"] = Position(
-            symbol="005930",
-            quantity=100,
-            avg_price=50000,
-            current_price=50000,
-            market_value=5000000,
-        )
+        portfolio_manager._portfolio.cash = cash
+        if position is not None:
+            portfolio_manager._portfolio.positions[position.symbol] = dataclasses.replace(position)
         
         proposal = OrderProposal(
             symbol="005930",
@@ -230,7 +171,4 @@ class TestPortfolioOperations:
             price=50000,
         )
         
-        passed, message = portfolio_manager.check_risk_limits(proposal)
-        
-        assert passed is False
-        assert "Cash reserve" in message
+        assert portfolio_manager.check_risk_limits(proposal) == expected
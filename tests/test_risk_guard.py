@@ -3,36 +3,50 @@ Tests for Risk Guard
 """
 
 import pytest
-from datetime import datetime
+from types import MappingProxyType
+
+from core.event_bus import Event
+from core.events import EventTypes
 
 from risk_guard import (
     RiskGuard,
     RiskCheckResult,
-    RiskCheckReport,
-    DailyLossRecord,
 )
 
 
+_RG_CONFIG = MappingProxyType({
+    "max_position_pct": 0.10,
+    "max_single_order_pct": 0.05,
+    "max_daily_loss_pct": 0.02,
+    "max_daily_trades": 20,
+    "min_cash_reserve_pct": 0.10,
+    "circuit_breaker_enabled": True,
+    "circuit_breaker_loss_pct": 0.05,
+})
+
+
 @pytest.fixture
-def event_bus():
-    from core.event_bus import EventBus
-    return EventBus()
+def make_buy():
+    base = {
+        "symbol": "005930",
+        "direction": "BUY",
+        "price": 50000,
+        "portfolio_total": 10000000,
+    }
+    return lambda quantity: {**base, "quantity": quantity}
+
+
+# Read-only tests share one guard; tests that block symbols, trip the
+# breaker, feed the position cache or get an order rejected (which bumps
+# the per-check rejection counters) get a fresh one
+@pytest.fixture(scope="module")
+def risk_guard(event_bus_stub):
+    return RiskGuard(event_bus=event_bus_stub, config=dict(_RG_CONFIG))
 
 
 @pytest.fixture
-def risk_guard(event_bus):
-    return RiskGuard(
-        event_bus=event_bus,
-        config={
-            "max_position_pct": 0.10,
-            "max_single_order_pct": 0.05,
-            "max_daily_loss_pct": 0.02,
-            "max_daily_trades": 20,
-            "min_cash_reserve_pct": 0.10,
-            "circuit_breaker_enabled": True,
-            "circuit_breaker_loss_pct": 0.05,
-        },
-    )
+def risk_guard_mutable(event_bus_stub):
+    return RiskGuard(event_bus=event_bus_stub, config=dict(_RG_CONFIG))
 
 
 class TestRiskGuard:
@@ -41,43 +55,34 @@ class TestRiskGuard:
         assert risk_guard._circuit_breaker_triggered is False
         assert len(risk_guard._blocked_symbols) == 0
 
-    @pytest.mark.asyncio
-    async def test_validate_order_passed(self, risk_guard):
-        result = await risk_guard.validate_order(
-            symbol="005930",
-            direction="BUY",
-            quantity=100,
-            price=50000,
-            portfolio_total=10000000,
+    def test_limits_read_from_config(self, risk_guard):
+        assert risk_guard._max_position_pct == _RG_CONFIG["max_position_pct"]
+        assert risk_guard._max_single_order_pct == _RG_CONFIG["max_single_order_pct"]
+        assert risk_guard._max_position_bp == 1000
+        assert risk_guard._max_single_order_bp == 500
+
+    async def test_validate_order_passed(self, risk_guard_mutable, make_buy):
+        result = await risk_guard_mutable.validate_order(
+            **make_buy(100),
             current_positions={},
         )
         
         assert result.result == RiskCheckResult.PASSED
         assert "passed" in result.message.lower()
 
-    @pytest.mark.asyncio
-    async def test_validate_order_blocked_symbol(self, risk_guard):
-        risk_guard.block_symbol("005930", "Testing block")
+    async def test_validate_order_blocked_symbol(self, risk_guard_mutable, make_buy):
+        risk_guard_mutable.block_symbol("005930", "Testing block")
         
-        result = await risk_guard.validate_order(
-            symbol="005930",
-            direction="BUY",
-            quantity=100,
-            price=50000,
-            portfolio_total=10000000,
+        result = await risk_guard_mutable.validate_order(
+            **make_buy(100),
             current_positions={},
         )
         
         assert result.result == RiskCheckResult.BLOCKED
 
-    @pytest.mark.asyncio
-    async def test_validate_order_exceeds_position_limit(self, risk_guard):
-        result = await risk_guard.validate_order(
-            symbol="005930",
-            direction="BUY",
-            quantity=300,
-            price=50000,
-            portfolio_total=10000000,
+    async def test_validate_order_exceeds_position_limit(self, risk_guard_mutable, make_buy):
+        result = await risk_guard_mutable.validate_order(
+            **make_buy(300),
             current_positions={
                 "005930": {"market_value": 4000000}
             },
@@ -85,28 +90,18 @@ class TestRiskGuard:
         
         assert result.result == RiskCheckResult.FAILED
 
-    @pytest.mark.asyncio
-    async def test_validate_order_exceeds_single_order_limit(self, risk_guard):
-        result = await risk_guard.validate_order(
-            symbol="005930",
-            direction="BUY",
-            quantity=200,
-            price=50000,
-            portfolio_total=10000000,
+    async def test_validate_order_exceeds_single_order_limit(self, risk_guard_mutable, make_buy):
+        result = await risk_guard_mutable.validate_order(
+            **make_buy(200),
             current_positions={},
         )
         
         assert result.result == RiskCheckResult.FAILED
         assert "exceeds" in result.message.lower()
 
-    @pytest.mark.asyncio
-    async def test_validate_order_cash_reserve_violation(self, risk_guard):
-        result = await risk_guard.validate_order(
-            symbol="005930",
-            direction="BUY",
-            quantity=200,
-            price=50000,
-            portfolio_total=10000000,
+    async def test_validate_order_cash_reserve_violation(self, risk_guard_mutable, make_buy):
+        result = await risk_guard_mutable.validate_order(
+            **make_buy(200),
             current_positions={
                 "000660": {"market_value": 9000000}
             },
@@ -114,111 +109,141 @@ class TestRiskGuard:
         
         assert result.result == RiskCheckResult.FAILED
 
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_trigger(self, risk_guard):
-        await risk_guard.update_daily_pnl(
-            realized_pnl=-600000,
-            unrealized_pnl=0,
-        )
+    async def test_validate_order_uses_cached_positions(self, risk_guard_mutable, make_buy):
+        risk_guard_mutable.update_position_value("000660", 5000000)
+        risk_guard_mutable.update_position_value("000660", 9000000)
+        
+        assert risk_guard_mutable._positions_mv_total == 9000000
+        
+        result = await risk_guard_mutable.validate_order(**make_buy(8))
         
-        assert risk_guard._circuit_breaker_triggered is True
+        assert result.result == RiskCheckResult.FAILED
+        assert "cash reserve" in result.message
 
-    def test_block_symbol(self, risk_guard):
-        risk_guard.block_symbol("005930", "Test block")
+    async def test_cached_positions_follow_portfolio_snapshots(self, risk_guard_mutable, make_buy):
+        result = await risk_guard_mutable.validate_order(**make_buy(8))
         
-        assert risk_guard.is_symbol_blocked("005930") is True
+        assert result.result == RiskCheckResult.BLOCKED
         
-        risk_guard.unblock_symbol("005930")
+        await risk_guard_mutable._on_portfolio_updated(Event(
+            type=EventTypes.PORTFOLIO_UPDATED,
+            payload={"positions": {"000660": {"market_value": 9000000}}},
+            source="portfolio_manager",
+        ))
+        result = await risk_guard_mutable.validate_order(**make_buy(8))
         
-        assert risk_guard.is_symbol_blocked("005930") is False
-
-    def test_get_status(self, risk_guard):
-        status = risk_guard.get_status()
+        assert result.result == RiskCheckResult.FAILED
+        assert "cash reserve" in result.message
         
-        assert "circuit_breaker_triggered" in status
-        assert "blocked_symbols" in status
-        assert "daily_trades" in status
-        assert "limits" in status
-
-
-class TestRiskCheckResult:
-    def test_risk_check_result_values(self):
-        assert RiskCheckResult.PASSED.value == "PASSED"
-        assert RiskCheckResult.FAILED.value == "FAILED"
-        assert RiskCheckResult.WARNING.value == "WARNING"
-        assert RiskCheckResult.BLOCKED.value == "BLOCKED"
-
+        await risk_guard_mutable._on_portfolio_updated(Event(
+            type=EventTypes.PORTFOLIO_UPDATED,
+            payload={"positions": {}},
+            source="portfolio_manager",
+        ))
+        
+        assert risk_guard_mutable._positions_mv_cache == {}
+        assert risk_guard_mutable._positions_mv_total == 0
 
-class TestRiskCheckReport:
-    def test_risk_check_report_creation(self):
-        report = RiskCheckReport(
-            check_name="test_check",
-            result=RiskCheckResult.PASSED,
-            message="Test passed",
-            details={"value": 100},
+    async def test_circuit_breaker_trigger(self, risk_guard_mutable):
+        await risk_guard_mutable.update_daily_pnl(
+            realized_pnl=-600000,
+            unrealized_pnl=0,
         )
         
-        assert report.check_name == "test_check"
-        assert report.result == RiskCheckResult.PASSED
-        assert report.message == "Test passed"
-        assert report.details["value"] == 100
+        assert risk_guard_mutable._circuit_breaker_triggered is True
 
-    def test_risk_check_report_defaults(self):
-        report = RiskCheckReport(
-            check_name="test",
-            result=RiskCheckResult.FAILED,
-            message="Failed",
+    async def test_checks_reordered_by_rejections(self, risk_guard_mutable, make_buy):
+        await risk_guard_mutable.validate_order(
+            **make_buy(8),
+            current_positions={"000660": {"market_value": 9000000}},
         )
         
-        assert report.details == {}
-        assert report.timestamp is not None
-
-
-class TestDailyLossRecord:
-    def test_daily_loss_record_creation(self):
-        record = DailyLossRecord(
-            date=datetime.now(),
-            realized_pnl=-100000,
-            unrealized_pnl=-50000,
-            trades_count=5,
+        risk_guard_mutable._reorder_checks()
+        
+        assert risk_guard_mutable._check_fns[0].__name__ == "_check_cash_reserve"
+
+    async def test_validate_orders_matches_single(self, risk_guard_mutable):
+        risk_guard_mutable.block_symbol("035420", "Testing block")
+        positions = {"000660": {"market_value": 8000000}}
+        orders = [
+            ("005930", "BUY", 8, 50000),
+            ("005930", "BUY", 200, 50000),
+            ("035420", "SELL", 1, 50000),
+            ("000660", "SELL", 5, 50000),
+        ]
+        
+        reports = await risk_guard_mutable.validate_orders(
+            symbols=[o[0] for o in orders],
+            directions=[o[1] for o in orders],
+            quantities=[o[2] for o in orders],
+            prices=[o[3] for o in orders],
+            portfolio_total=10000000,
+            current_positions=positions,
         )
         
-        assert record.realized_pnl == -100000
-        assert record.unrealized_pnl == -50000
-        assert record.trades_count == 5
+        for report, (symbol, direction, quantity, price) in zip(reports, orders, strict=True):
+            single = await risk_guard_mutable.validate_order(
+                symbol=symbol,
+                direction=direction,
+                quantity=quantity,
+                price=price,
+                portfolio_total=10000000,
+                current_positions=positions,
+            )
+            assert report.result == single.result
+            assert report.message == single.message
 
-    def test_daily_loss_record_defaults(self):
-        record = DailyLossRecord(date=datetime.now())
+    def test_block_symbol(self, risk_guard_mutable):
+        risk_guard_mutable.block_symbol("005930", "Test block")
         
-        assert record.realized_pnl == 0
-        assert record.unrealized_pnl == 0
-        assert record.trades_count == 0
+        assert risk_guard_mutable.is_symbol_blocked("005930") is True
+        
+        risk_guard_mutable.unblock_symbol("005930")
+        
+        assert risk_guard_mutable.is_symbol_blocked("005930") is False
+
+    def test_get_status(self, risk_guard):
+        status = risk_guard.get_status()
+        
+        assert "circuit_breaker_triggered" in status
+        assert "blocked_symbols" in status
+        assert "daily_trades" in status
+        assert "limits" in status
 
 
 class TestPositionLimits:
-    @pytest.mark.asyncio
-    async def test_check_position_limits_warning(self, risk_guard):
+    def test_check_position_limits_warning(self, risk_guard):
         positions = {
             "005930": {"market_value": 2000000},
             "000660": {"market_value": 1500000},
         }
         
-        reports = await risk_guard.check_position_limits(
+        reports = risk_guard.check_position_limits_iter(
             positions=positions,
             portfolio_total=10000000,
         )
         
-        assert len(reports) > 0
+        assert next(reports, None) is not None
 
-    @pytest.mark.asyncio
-    async def test_check_position_limits_ok(self, risk_guard):
+    def test_check_position_limits_ok(self, risk_guard):
         positions = {
             "005930": {"market_value": 500000},
         }
         
-        reports = await risk_guard.check_position_limits(
+        reports = risk_guard.check_position_limits_iter(
             positions=positions,
             portfolio_total=10000000,
         )
         
-        assert len(reports) == 0
+        assert next(reports, None) is None
+
+    async def test_check_position_limits_cached(self, risk_guard_mutable):
+        risk_guard_mutable.update_position_value("005930", 2000000)
+        risk_guard_mutable.update_position_value("000660", 500000)
+        
+        reports = await risk_guard_mutable.check_position_limits(
+            positions=None,
+            portfolio_total=10000000,
+        )
+        
+        assert [r.details["symbol"] for r in reports] == ["005930"]